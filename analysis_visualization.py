@@ -5,15 +5,12 @@ CS-5115-100 - Programming Prep for Grad Stu
 Extended analysis beyond the basic requirements
 """
 
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import numpy as np
-from scipy import stats
-from contact_manager import *
+# The plotting/analysis stack is imported inside the functions that use it, so
+# importing this module (e.g. for practical_recommendations) stays cheap.
 
 def load_and_analyze_results():
     """Load performance results and conduct additional statistical analysis."""
+    import pandas as pd
     
     # Load the generated CSV results
     df = pd.read_csv('performance_results.csv')
@@ -114,6 +111,10 @@ def memory_usage_analysis():
 
 def create_advanced_visualizations(df):
     """Create additional visualizations for deeper analysis."""
+    import pandas as pd
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    import numpy as np
     
     plt.style.use('seaborn-v0_8')
     
@@ -193,6 +194,7 @@ def create_advanced_visualizations(df):
 
 def statistical_significance_test(df):
     """Perform statistical tests on performance differences."""
+    import numpy as np
     
     print("\n=== STATISTICAL SIGNIFICANCE TESTS ===")
     
@@ -0,0 +1,78 @@
+"""Dependency-free core of the contact management system.
+
+Only the standard library is imported here, so services that just need a
+backend such as HashMapContacts do not pay for pandas/matplotlib. The
+benchmarking and reporting layer lives in contact_management_system.py.
+"""
+
+from .models import Contact, ContactManager
+from .instrumentation import OperationCounters
+from .structures import (
+    ArrayContacts,
+    BSTContacts,
+    BSTNode,
+    HashMapContacts,
+    IndexedArrayContacts,
+    LinkedListContacts,
+    ListNode,
+    SELF_ORGANIZING_POLICIES,
+)
+from .aggregates import AggregateView, ContactAggregates, email_domain, phone_area_code
+from .dedupe import (
+    MERGE_POLICIES,
+    DedupeEngine,
+    DuplicateGroup,
+    merge_keep_first,
+    merge_keep_last,
+    merge_most_complete,
+    name_key,
+    name_similarity,
+    normalize_email,
+    normalize_phone,
+    soundex,
+)
+from .bloom import BloomFilter, BloomGuardedContacts, CountingBloomFilter
+from .sync import LocalPeer, MerkleIndex, MerkleSync, SyncDelta, contact_digest
+from .tiered import ColdStore, TieredContacts, contact_bytes
+from .datagen import DataGenerator
+
+__all__ = [
+    'Contact',
+    'ContactManager',
+    'OperationCounters',
+    'ArrayContacts',
+    'IndexedArrayContacts',
+    'LinkedListContacts',
+    'ListNode',
+    'SELF_ORGANIZING_POLICIES',
+    'HashMapContacts',
+    'BSTContacts',
+    'BSTNode',
+    'AggregateView',
+    'ContactAggregates',
+    'email_domain',
+    'phone_area_code',
+    'DedupeEngine',
+    'DuplicateGroup',
+    'MERGE_POLICIES',
+    'merge_keep_first',
+    'merge_keep_last',
+    'merge_most_complete',
+    'name_key',
+    'name_similarity',
+    'normalize_email',
+    'normalize_phone',
+    'soundex',
+    'BloomFilter',
+    'CountingBloomFilter',
+    'BloomGuardedContacts',
+    'MerkleIndex',
+    'MerkleSync',
+    'LocalPeer',
+    'SyncDelta',
+    'contact_digest',
+    'TieredContacts',
+    'ColdStore',
+    'contact_bytes',
+    'DataGenerator',
+]
@@ -0,0 +1,103 @@
+"""Materialized per-group counts kept up to date by ContactManager hooks."""
+
+import heapq
+from typing import Callable, Dict, Hashable, List, Tuple
+
+from .models import Contact, ContactManager
+
+# ==================== MATERIALIZED AGGREGATES ====================
+def email_domain(contact: Contact) -> str:
+    """Group key: lower-cased email domain ('' when the email has no '@')."""
+    _, at, domain = contact.email.rpartition('@')
+    return domain.lower() if at else ''
+
+def phone_area_code(contact: Contact) -> str:
+    """Group key: 3-digit area code of a 10-digit (or 1-prefixed 11-digit) phone."""
+    digits = ''.join(ch for ch in contact.phone if ch.isdigit())
+    if len(digits) == 11 and digits[0] == '1':
+        digits = digits[1:]
+    return digits[:3] if len(digits) == 10 else ''
+
+class AggregateView:
+    """Materialized per-group contact counts, maintained in O(1) per mutation.
+    
+    Attach with ``manager.attach_view(view)``. The view remembers the group each
+    contact was counted under, keyed by the manager's handle for it, so the
+    in-place field changes made by update() move the contact to its new group
+    without rescanning the data, and a delete decrements the group the contact
+    was counted in even if the object was changed elsewhere in the meantime.
+    """
+    
+    def __init__(self, key_func: Callable[[Contact], str]):
+        self.key_func = key_func
+        self.counts: Dict[str, int] = {}
+        # handle -> group of each stored occurrence (one object may be stored twice)
+        self._keys: Dict[Hashable, List[str]] = {}
+    
+    def _add(self, key: str) -> None:
+        self.counts[key] = self.counts.get(key, 0) + 1
+    
+    def _remove(self, key: str) -> None:
+        remaining = self.counts[key] - 1
+        if remaining:
+            self.counts[key] = remaining
+        else:
+            del self.counts[key]
+    
+    def on_insert(self, handle: Hashable, contact: Contact) -> None:
+        key = self.key_func(contact)
+        self._keys.setdefault(handle, []).append(key)
+        self._add(key)
+    
+    def on_delete(self, handle: Hashable, contact: Contact) -> None:
+        keys = self._keys[handle]
+        self._remove(keys.pop())
+        if not keys:
+            del self._keys[handle]
+    
+    def on_update(self, handle: Hashable, contact: Contact) -> None:
+        new_key = self.key_func(contact)
+        keys = self._keys[handle]
+        for i, old_key in enumerate(keys):
+            if old_key != new_key:
+                self._remove(old_key)
+                self._add(new_key)
+                keys[i] = new_key
+    
+    def count(self, key: str) -> int:
+        """Number of contacts currently in the given group."""
+        return self.counts.get(key, 0)
+    
+    def top_k(self, k: int) -> List[Tuple[str, int]]:
+        """The k largest groups as (key, count) pairs. O(g log k) for g groups."""
+        return heapq.nlargest(k, self.counts.items(), key=lambda item: item[1])
+    
+    def __len__(self) -> int:
+        return len(self.counts)
+
+class ContactAggregates:
+    """Per-email-domain and per-area-code counts attached to a ContactManager."""
+    
+    def __init__(self, manager: ContactManager):
+        self.manager = manager
+        self.by_domain = AggregateView(email_domain)
+        self.by_area_code = AggregateView(phone_area_code)
+        manager.attach_view(self.by_domain)
+        manager.attach_view(self.by_area_code)
+    
+    def detach(self) -> None:
+        """Stop maintaining the aggregates."""
+        self.manager.detach_view(self.by_domain)
+        self.manager.detach_view(self.by_area_code)
+    
+    def domain_count(self, domain: str) -> int:
+        return self.by_domain.count(domain.lower())
+    
+    def area_code_count(self, area_code: str) -> int:
+        return self.by_area_code.count(area_code)
+    
+    def top_k_domains(self, k: int = 5) -> List[Tuple[str, int]]:
+        return self.by_domain.top_k(k)
+    
+    def top_k_area_codes(self, k: int = 5) -> List[Tuple[str, int]]:
+        return self.by_area_code.top_k(k)
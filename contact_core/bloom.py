@@ -0,0 +1,173 @@
+"""Bloom filter front guard that short-circuits definite misses."""
+
+import hashlib
+import math
+from typing import Iterator, Optional
+
+from .models import Contact, ContactManager
+
+# ==================== BLOOM FILTERS ====================
+class BloomFilter:
+    """Plain Bloom filter over strings: no false negatives, tunable false positives.
+    
+    Sized for ``capacity`` keys at ``false_positive_rate``. Bit positions come
+    from double hashing a single blake2b digest, so they are stable across
+    processes. Keys cannot be removed; see CountingBloomFilter.
+    """
+    
+    def __init__(self, capacity: int, false_positive_rate: float = 0.01):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be in (0, 1)")
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.num_slots = max(8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_slots / capacity * math.log(2)))
+        self.count = 0
+        self._allocate()
+    
+    def _allocate(self) -> None:
+        self.bits = bytearray((self.num_slots + 7) // 8)
+    
+    def _positions(self, key: str) -> Iterator[int]:
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_slots
+    
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+    
+    def __contains__(self, key: str) -> bool:
+        """False means key was definitely never added; True means it probably was."""
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+    
+    def estimated_false_positive_rate(self) -> float:
+        """Expected false-positive rate for the number of keys currently added."""
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_slots)) ** self.num_hashes
+
+class CountingBloomFilter(BloomFilter):
+    """Bloom filter with an 8-bit counter per slot, so keys can be removed.
+    
+    Counters saturate at 255 and are then never decremented, which can only
+    leave extra false positives, never false negatives.
+    """
+    
+    def _allocate(self) -> None:
+        self.counters = bytearray(self.num_slots)
+    
+    def add(self, key: str) -> None:
+        counters = self.counters
+        for pos in self._positions(key):
+            if counters[pos] < 255:
+                counters[pos] += 1
+        self.count += 1
+    
+    def remove(self, key: str) -> bool:
+        """Remove one previously added occurrence of key."""
+        if key not in self:
+            return False
+        counters = self.counters
+        for pos in self._positions(key):
+            if counters[pos] < 255:
+                counters[pos] -= 1
+        self.count -= 1
+        return True
+    
+    def __contains__(self, key: str) -> bool:
+        counters = self.counters
+        return all(counters[pos] for pos in self._positions(key))
+
+# ==================== GUARDED CONTACT MANAGER ====================
+class BloomGuardedContacts(ContactManager):
+    """Wraps any ContactManager with a Bloom filter on contact names.
+    
+    search, update and delete for names the filter has never seen return
+    immediately without touching the backend, which turns the worst-case miss
+    of a linear or on-disk store into a few hash probes. With ``counting``
+    (the default) deletes are removed from the filter; otherwise deleted names
+    stay as harmless false positives. The filter is rebuilt from the backend
+    at double the capacity whenever it fills up.
+    """
+    
+    def __init__(self, backend: ContactManager, capacity: int = 1024,
+                 false_positive_rate: float = 0.01, counting: bool = True):
+        self.backend = backend
+        self.false_positive_rate = false_positive_rate
+        self.counting = counting
+        self.filtered = 0          # Lookups answered by the filter alone
+        self.passed = 0            # Lookups forwarded to the backend
+        self.false_positives = 0   # Forwarded lookups the backend then missed
+        self._rebuild(max(capacity, backend.size()))
+    
+    def _rebuild(self, capacity: int) -> None:
+        filter_class = CountingBloomFilter if self.counting else BloomFilter
+        self.filter = filter_class(capacity, self.false_positive_rate)
+        for contact in self.backend:
+            self.filter.add(contact.name)
+    
+    def _admit(self, name: str) -> bool:
+        if name in self.filter:
+            self.passed += 1
+            return True
+        self.filtered += 1
+        return False
+    
+    def insert(self, contact: Contact) -> None:
+        size = self.backend.size()
+        self.backend.insert(contact)
+        if self.backend.size() == size:
+            return  # Replaced a contact whose name the filter already holds
+        if self.filter.count >= self.filter.capacity:
+            self._rebuild(self.filter.capacity * 2)
+        else:
+            self.filter.add(contact.name)
+    
+    def search(self, name: str) -> Optional[Contact]:
+        if not self._admit(name):
+            return None
+        contact = self.backend.search(name)
+        if contact is None:
+            self.false_positives += 1
+        return contact
+    
+    def delete(self, name: str) -> bool:
+        if not self._admit(name):
+            return False
+        deleted = self.backend.delete(name)
+        if not deleted:
+            self.false_positives += 1
+        elif self.counting:
+            self.filter.remove(name)
+        return deleted
+    
+    def update(self, name: str, phone: str = None, email: str = None) -> bool:
+        if not self._admit(name):
+            return False
+        updated = self.backend.update(name, phone, email)
+        if not updated:
+            self.false_positives += 1
+        return updated
+    
+    def observed_false_positive_rate(self) -> float:
+        """Fraction of lookups for absent names that the filter let through."""
+        misses = self.false_positives + self.filtered
+        return self.false_positives / misses if misses else 0.0
+    
+    def size(self) -> int:
+        return self.backend.size()
+    
+    def __iter__(self) -> Iterator[Contact]:
+        return iter(self.backend)
+    
+    def attach_view(self, view) -> None:
+        """Views observe the backend, which performs the actual mutations."""
+        self.backend.attach_view(view)
+    
+    def detach_view(self, view) -> None:
+        self.backend.detach_view(view)
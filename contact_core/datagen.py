@@ -0,0 +1,51 @@
+"""Synthetic contact data for benchmarks and demos."""
+
+import random
+import string
+from typing import List, Optional
+
+from .models import Contact
+
+# ==================== UTILITY FUNCTIONS ====================
+class DataGenerator:
+    """Utility class for generating test data.
+    
+    Each method draws from ``rng`` when given (a random.Random), otherwise
+    from the global random module.
+    """
+    
+    @staticmethod
+    def random_name(length: int = 8, rng: Optional[random.Random] = None) -> str:
+        """Generate a random name."""
+        return ''.join((rng or random).choices(string.ascii_letters, k=length)).title()
+    
+    @staticmethod
+    def random_phone(rng: Optional[random.Random] = None) -> str:
+        """Generate a random phone number."""
+        return ''.join((rng or random).choices(string.digits, k=10))
+    
+    @staticmethod
+    def random_email(name: str, rng: Optional[random.Random] = None) -> str:
+        """Generate a random email based on name."""
+        domains = ['gmail.com', 'yahoo.com', 'hotmail.com', 'example.com']
+        return f"{name.lower()}@{(rng or random).choice(domains)}"
+    
+    @staticmethod
+    def generate_contacts(n: int, rng: Optional[random.Random] = None) -> List[Contact]:
+        """Generate n random contacts."""
+        contacts = []
+        names_used = set()
+        
+        for _ in range(n):
+            # Ensure unique names
+            while True:
+                name = DataGenerator.random_name(rng=rng)
+                if name not in names_used:
+                    names_used.add(name)
+                    break
+            
+            phone = DataGenerator.random_phone(rng)
+            email = DataGenerator.random_email(name, rng)
+            contacts.append(Contact(name, phone, email))
+        
+        return contacts
@@ -0,0 +1,225 @@
+"""Blocking-based duplicate detection and merging for bulk imports."""
+
+import difflib
+from collections import Counter
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from .models import Contact, ContactManager
+
+# ==================== DUPLICATE DETECTION ====================
+def normalize_phone(phone: str) -> str:
+    """Digits only, with a leading country code '1' dropped from 11-digit numbers."""
+    digits = ''.join(ch for ch in phone if ch.isdigit())
+    if len(digits) == 11 and digits[0] == '1':
+        digits = digits[1:]
+    return digits
+
+def normalize_email(email: str) -> str:
+    """Lower-cased email with any '+tag' suffix removed from the local part."""
+    local, at, domain = email.strip().lower().partition('@')
+    if not at:
+        return local
+    return f"{local.split('+', 1)[0]}@{domain}"
+
+def soundex(word: str) -> str:
+    """American Soundex code of a word (e.g. 'Robert' -> 'R163')."""
+    codes = {}
+    for letters, digit in (('bfpv', '1'), ('cgjkqsxz', '2'), ('dt', '3'),
+                           ('l', '4'), ('mn', '5'), ('r', '6')):
+        for letter in letters:
+            codes[letter] = digit
+    
+    letters = [ch for ch in word.lower() if ch.isalpha()]
+    if not letters:
+        return ''
+    
+    result = letters[0].upper()
+    previous = codes.get(letters[0], '')
+    for ch in letters[1:]:
+        digit = codes.get(ch, '')
+        if digit and digit != previous:
+            result += digit
+            if len(result) == 4:
+                break
+        if ch not in 'hw':  # h and w do not separate equal codes
+            previous = digit
+    return result.ljust(4, '0')
+
+def name_key(name: str) -> str:
+    """Sound-alike blocking key: Soundex of the first and last name tokens."""
+    tokens = name.split()
+    if not tokens:
+        return ''
+    if len(tokens) == 1:
+        return soundex(tokens[0])
+    return soundex(tokens[0]) + soundex(tokens[-1])
+
+def name_similarity(a: str, b: str) -> float:
+    """Case-insensitive similarity ratio of two names in [0, 1]."""
+    return difflib.SequenceMatcher(None, a.lower(), b.lower()).ratio()
+
+def _names_similar(a: str, b: str, threshold: float) -> bool:
+    """name_similarity(a, b) >= threshold for lower-cased names, using difflib's
+    cheap upper bounds to reject most pairs before the full ratio()."""
+    matcher = difflib.SequenceMatcher(None, a, b)
+    return (matcher.real_quick_ratio() >= threshold and
+            matcher.quick_ratio() >= threshold and
+            matcher.ratio() >= threshold)
+
+def merge_keep_first(group: List[Contact]) -> Contact:
+    """Keep the first contact seen, unchanged."""
+    first = group[0]
+    return Contact(first.name, first.phone, first.email)
+
+def merge_keep_last(group: List[Contact]) -> Contact:
+    """Keep the most recently seen contact, unchanged."""
+    last = group[-1]
+    return Contact(last.name, last.phone, last.email)
+
+def merge_most_complete(group: List[Contact]) -> Contact:
+    """Longest name, plus the first non-empty phone and email in the group."""
+    name = max((c.name for c in group), key=len)
+    phone = next((c.phone for c in group if c.phone), '')
+    email = next((c.email for c in group if c.email), '')
+    return Contact(name, phone, email)
+
+MERGE_POLICIES: Dict[str, Callable[[List[Contact]], Contact]] = {
+    'keep_first': merge_keep_first,
+    'keep_last': merge_keep_last,
+    'most_complete': merge_most_complete,
+}
+
+class DuplicateGroup:
+    """A cluster of contacts judged to be the same person, and their merge."""
+    
+    def __init__(self, members: List[Contact], merged: Contact):
+        self.members = members
+        self.merged = merged
+    
+    def __repr__(self):
+        return f"DuplicateGroup({len(self.members)} members -> {self.merged!r})"
+
+class DedupeEngine:
+    """Blocking-based duplicate detection over any collection of contacts.
+    
+    Contacts are grouped into blocks by normalized phone, normalized email and
+    a Soundex name key, and only pairs inside a block are compared, so the cost
+    is the sum of squared block sizes rather than O(n^2). Two contacts match when
+    they share a phone or email and their names are at least ``name_threshold``
+    similar, or, with no shared phone/email, when their names are at least
+    ``name_only_threshold`` similar (pass None to disable name-only matches).
+    Within a name block each contact is only compared with the next ``window``
+    names in sorted order. Blocks larger than ``max_block_size`` are skipped as
+    too unselective.
+    """
+    
+    def __init__(self, merge_policy='most_complete', name_threshold: float = 0.6,
+                 name_only_threshold: Optional[float] = 0.95, max_block_size: int = 1000,
+                 window: int = 8):
+        if isinstance(merge_policy, str):
+            if merge_policy not in MERGE_POLICIES:
+                raise ValueError(f"Unknown merge policy: {merge_policy!r}")
+            merge_policy = MERGE_POLICIES[merge_policy]
+        self.merge_policy = merge_policy
+        self.name_threshold = name_threshold
+        self.name_only_threshold = name_only_threshold
+        self.max_block_size = max_block_size
+        self.window = window
+    
+    def _blocks(self, normalized: List[Tuple[str, str, str]]) -> Iterator[Tuple[str, List[int]]]:
+        blocks: Dict[Tuple[str, str], List[int]] = {}
+        use_names = self.name_only_threshold is not None
+        for i, (phone, email, name) in enumerate(normalized):
+            if phone:
+                blocks.setdefault(('phone', phone), []).append(i)
+            if email:
+                blocks.setdefault(('email', email), []).append(i)
+            if use_names:
+                key = name_key(name)
+                if key:
+                    blocks.setdefault(('name', key), []).append(i)
+        for (kind, _), block in blocks.items():
+            if 1 < len(block) <= self.max_block_size:
+                yield kind, block
+    
+    def _is_match(self, a: Tuple[str, str, str], b: Tuple[str, str, str]) -> bool:
+        shared = (a[0] and a[0] == b[0]) or (a[1] and a[1] == b[1])
+        threshold = self.name_threshold if shared else self.name_only_threshold
+        if threshold is None:
+            return False
+        return _names_similar(a[2], b[2], threshold)
+    
+    def find_duplicates(self, contacts, batch_size: int = 100) -> Iterator[List[DuplicateGroup]]:
+        """Yield lists of up to batch_size DuplicateGroups.
+        
+        ``contacts`` may be a ContactManager of any backend or any iterable of
+        Contact objects. Groups are connected components of matching pairs.
+        Only the output is batched: every contact is read and clustered before
+        the first batch is yielded, because a later block can still join two
+        groups found earlier.
+        """
+        contacts = list(contacts)
+        normalized = [(normalize_phone(c.phone), normalize_email(c.email), c.name.lower())
+                      for c in contacts]
+        parent = list(range(len(contacts)))
+        
+        def _find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        
+        for kind, block in self._blocks(normalized):
+            span = len(block)
+            if kind == 'name':
+                # Sorted neighbourhood: sound-alike blocks can be large, so only
+                # compare each name with its nearest neighbours in sorted order
+                block.sort(key=lambda i: normalized[i][2])
+                span = self.window + 1
+            for x in range(len(block)):
+                for y in range(x + 1, min(x + span, len(block))):
+                    i, j = block[x], block[y]
+                    root_i, root_j = _find(i), _find(j)
+                    if root_i != root_j and self._is_match(normalized[i], normalized[j]):
+                        parent[max(root_i, root_j)] = min(root_i, root_j)
+        
+        clusters: Dict[int, List[Contact]] = {}
+        for i, contact in enumerate(contacts):
+            clusters.setdefault(_find(i), []).append(contact)
+        
+        batch = []
+        for members in clusters.values():
+            if len(members) < 2:
+                continue
+            batch.append(DuplicateGroup(members, self.merge_policy(members)))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    
+    def merge_into(self, manager: ContactManager, batch_size: int = 100) -> int:
+        """Replace every duplicate group in manager with its merged contact.
+        
+        Backends delete by name, so a group is only merged when every contact
+        stored under its members' names (and the merged name) belongs to the
+        group; otherwise deleting by name could remove an unrelated contact,
+        and the group is left as it is. Returns the number of contacts removed.
+        """
+        contacts = list(manager)
+        name_counts = Counter(contact.name for contact in contacts)
+        removed = 0
+        for batch in self.find_duplicates(contacts, batch_size):
+            for group in batch:
+                member_counts = Counter(member.name for member in group.members)
+                names = set(member_counts) | {group.merged.name}
+                if any(name_counts[name] != member_counts[name] for name in names):
+                    continue  # A name is shared with contacts outside the group
+                for name, count in member_counts.items():
+                    for _ in range(count):
+                        manager.delete(name)
+                    name_counts[name] -= count
+                manager.insert(group.merged)
+                name_counts[group.merged.name] += 1
+                removed += len(group.members) - 1
+        return removed
@@ -0,0 +1,42 @@
+"""Opt-in counters of algorithmic work done by the contact backends."""
+
+from typing import Dict
+
+class OperationCounters:
+    """Per-operation totals of key comparisons, nodes visited and element shifts.
+    
+    Backends tally work in local variables inside the loops that do it and
+    only record here when instrumentation is enabled, so the counts measure
+    the algorithm rather than the interpreter and cost little when off.
+    """
+    
+    FIELDS = ('calls', 'comparisons', 'nodes_visited', 'shifts')
+    
+    def __init__(self):
+        self.totals: Dict[str, list] = {}
+    
+    def record(self, operation: str, comparisons: int = 0, nodes_visited: int = 0,
+               shifts: int = 0) -> None:
+        """Add the work done by one call of the given operation."""
+        totals = self.totals.get(operation)
+        if totals is None:
+            totals = self.totals[operation] = [0, 0, 0, 0]
+        totals[0] += 1
+        totals[1] += comparisons
+        totals[2] += nodes_visited
+        totals[3] += shifts
+    
+    def total(self, operation: str, field: str) -> int:
+        totals = self.totals.get(operation)
+        return totals[self.FIELDS.index(field)] if totals else 0
+    
+    def average(self, operation: str, field: str) -> float:
+        """Mean of field per call of operation (0.0 if it was never called)."""
+        calls = self.total(operation, 'calls')
+        return self.total(operation, field) / calls if calls else 0.0
+    
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        return {op: dict(zip(self.FIELDS, totals)) for op, totals in self.totals.items()}
+    
+    def reset(self) -> None:
+        self.totals.clear()
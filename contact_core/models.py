@@ -0,0 +1,119 @@
+"""Contact record and the ContactManager interface shared by every backend."""
+
+from abc import ABC, abstractmethod
+from typing import Hashable, Iterator, Optional
+
+from .instrumentation import OperationCounters
+
+# ==================== CONTACT CLASS ====================
+class Contact:
+    """Represents a contact with name, phone, and email."""
+    
+    def __init__(self, name: str, phone: str, email: str):
+        self.name = name
+        self.phone = phone
+        self.email = email
+    
+    def __repr__(self):
+        return f"Contact('{self.name}', '{self.phone}', '{self.email}')"
+    
+    def __str__(self):
+        return f"{self.name} | {self.phone} | {self.email}"
+
+# ==================== ABSTRACT BASE CLASS ====================
+class ContactManager(ABC):
+    """Abstract base class for all contact management implementations."""
+    
+    # Attached views (see AggregateView); an empty tuple keeps the hot path cheap
+    _views = ()
+    
+    # Work counters (see enable_instrumentation); None means instrumentation is off
+    counters = None
+    
+    # True when a name identifies at most one contact (inserting an existing
+    # name replaces it); views then track contacts by name, not object identity
+    _unique_names = False
+    
+    @abstractmethod
+    def insert(self, contact: Contact) -> None:
+        pass
+    
+    @abstractmethod
+    def search(self, name: str) -> Optional[Contact]:
+        pass
+    
+    @abstractmethod
+    def delete(self, name: str) -> bool:
+        pass
+    
+    @abstractmethod
+    def update(self, name: str, phone: str = None, email: str = None) -> bool:
+        pass
+    
+    @abstractmethod
+    def size(self) -> int:
+        pass
+    
+    @abstractmethod
+    def __iter__(self) -> Iterator[Contact]:
+        pass
+    
+    def insert_many(self, contacts) -> None:
+        """Insert a batch of contacts (e.g. a sync delta or bulk import)."""
+        for contact in contacts:
+            self.insert(contact)
+    
+    def attach_view(self, view) -> None:
+        """Attach a view that is notified of every insert, delete and update.
+        
+        A view implements on_insert, on_delete and on_update, each called with
+        (handle, contact). The handle identifies the stored contact for as long
+        as it stays in this manager, so a view can remember what it recorded at
+        insert time instead of trusting the contact's current fields, which
+        may have been changed through another manager sharing the object.
+        """
+        if not self._views:
+            self._views = []
+        self._views.append(view)
+        for contact in self:
+            view.on_insert(self._handle(contact), contact)
+    
+    def detach_view(self, view) -> None:
+        """Stop notifying a previously attached view."""
+        self._views.remove(view)
+    
+    def enable_instrumentation(self) -> OperationCounters:
+        """Start counting comparisons, nodes visited and shifts per operation."""
+        self.counters = OperationCounters()
+        return self.counters
+    
+    def disable_instrumentation(self) -> None:
+        self.counters = None
+    
+    def _handle(self, contact: Contact) -> Hashable:
+        """The key views track contact under: its name or the object's id."""
+        return contact.name if self._unique_names else id(contact)
+    
+    def _notify_insert(self, contact: Contact) -> None:
+        handle = self._handle(contact)
+        for view in self._views:
+            view.on_insert(handle, contact)
+    
+    def _notify_delete(self, contact: Contact) -> None:
+        handle = self._handle(contact)
+        for view in self._views:
+            view.on_delete(handle, contact)
+    
+    def _notify_update(self, contact: Contact) -> None:
+        handle = self._handle(contact)
+        for view in self._views:
+            view.on_update(handle, contact)
+    
+    def _apply_update(self, contact: Contact, phone: str = None, email: str = None) -> None:
+        """Change a stored contact's fields for update() and notify the views."""
+        if phone:
+            contact.phone = phone
+        if email:
+            contact.email = email
+        if self._views:
+            self._notify_update(contact)
@@ -0,0 +1,561 @@
+"""Array, indexed array, linked list, hash map and binary search tree contact backends."""
+
+from typing import Dict, List, Optional, Iterator
+
+from .models import Contact, ContactManager
+
+# ==================== ARRAY-BASED IMPLEMENTATION ====================
+class ArrayContacts(ContactManager):
+    """Array-based contact management system."""
+    
+    def __init__(self):
+        self.contacts = []
+    
+    def insert(self, contact: Contact) -> None:
+        """Insert a new contact. O(1) amortized time complexity."""
+        if self.counters is not None:
+            self.counters.record('insert')
+        self.contacts.append(contact)
+        if self._views:
+            self._notify_insert(contact)
+    
+    def _find(self, name: str, operation: str) -> Optional[Contact]:
+        for i, contact in enumerate(self.contacts):
+            if contact.name == name:
+                if self.counters is not None:
+                    self.counters.record(operation, comparisons=i + 1, nodes_visited=i + 1)
+                return contact
+        if self.counters is not None:
+            n = len(self.contacts)
+            self.counters.record(operation, comparisons=n, nodes_visited=n)
+        return None
+    
+    def search(self, name: str) -> Optional[Contact]:
+        """Search for a contact by name. O(n) time complexity."""
+        return self._find(name, 'search')
+    
+    def delete(self, name: str) -> bool:
+        """Delete a contact by name. O(n) time complexity."""
+        for i, contact in enumerate(self.contacts):
+            if contact.name == name:
+                self.contacts.pop(i)
+                if self.counters is not None:
+                    self.counters.record('delete', comparisons=i + 1, nodes_visited=i + 1,
+                                         shifts=len(self.contacts) - i)
+                if self._views:
+                    self._notify_delete(contact)
+                return True
+        if self.counters is not None:
+            n = len(self.contacts)
+            self.counters.record('delete', comparisons=n, nodes_visited=n)
+        return False
+    
+    def update(self, name: str, phone: str = None, email: str = None) -> bool:
+        """Update a contact's information. O(n) time complexity."""
+        contact = self._find(name, 'update')
+        if contact:
+            self._apply_update(contact, phone, email)
+            return True
+        return False
+    
+    def size(self) -> int:
+        return len(self.contacts)
+    
+    def __iter__(self) -> Iterator[Contact]:
+        return iter(self.contacts)
+
+# ==================== INDEXED ARRAY IMPLEMENTATION ====================
+class IndexedArrayContacts(ContactManager):
+    """Array of contact slots with a name -> slot index.
+    
+    Search, update and delete are O(1) average. With ``preserve_order`` (the
+    default) deletes leave a tombstone (None) and the array is compacted once
+    the dead-slot ratio reaches ``compaction_threshold``, keeping insertion
+    order. Otherwise deletes swap the last contact into the freed slot.
+    Like HashMapContacts, inserting an existing name replaces that contact.
+    """
+    
+    _unique_names = True
+    
+    def __init__(self, preserve_order: bool = True, compaction_threshold: float = 0.5):
+        if not 0 < compaction_threshold <= 1:
+            raise ValueError("compaction_threshold must be in (0, 1]")
+        self.slots: List[Optional[Contact]] = []
+        self.index: Dict[str, int] = {}
+        self.preserve_order = preserve_order
+        self.compaction_threshold = compaction_threshold
+        self._dead = 0
+    
+    def insert(self, contact: Contact) -> None:
+        """Insert a new contact. O(1) amortized time complexity."""
+        if self.counters is not None:
+            self.counters.record('insert', comparisons=1, nodes_visited=1)
+        slot = self.index.get(contact.name)
+        if slot is not None:
+            replaced = self.slots[slot]
+            self.slots[slot] = contact
+            if self._views:
+                self._notify_delete(replaced)
+        else:
+            self.index[contact.name] = len(self.slots)
+            self.slots.append(contact)
+        if self._views:
+            self._notify_insert(contact)
+    
+    def search(self, name: str) -> Optional[Contact]:
+        """Search for a contact by name. O(1) average time complexity."""
+        if self.counters is not None:
+            self.counters.record('search', comparisons=1, nodes_visited=1)
+        slot = self.index.get(name)
+        return None if slot is None else self.slots[slot]
+    
+    def delete(self, name: str) -> bool:
+        """Delete a contact by name. O(1) amortized time complexity."""
+        slot = self.index.pop(name, None)
+        if slot is None:
+            if self.counters is not None:
+                self.counters.record('delete', comparisons=1, nodes_visited=1)
+            return False
+        
+        removed = self.slots[slot]
+        shifts = 0
+        if self.preserve_order:
+            self.slots[slot] = None
+            self._dead += 1
+            if self._dead >= self.compaction_threshold * len(self.slots):
+                shifts = self.compact()
+        else:
+            last = self.slots.pop()
+            if slot < len(self.slots):
+                self.slots[slot] = last
+                self.index[last.name] = slot
+                shifts = 1
+        
+        if self.counters is not None:
+            self.counters.record('delete', comparisons=1, nodes_visited=1, shifts=shifts)
+        if self._views:
+            self._notify_delete(removed)
+        return True
+    
+    def compact(self) -> int:
+        """Drop tombstones, keeping insertion order. Returns the contacts moved."""
+        live = [contact for contact in self.slots if contact is not None]
+        self.slots = live
+        self.index = {contact.name: slot for slot, contact in enumerate(live)}
+        self._dead = 0
+        return len(live)
+    
+    def update(self, name: str, phone: str = None, email: str = None) -> bool:
+        """Update a contact's information. O(1) average time complexity."""
+        if self.counters is not None:
+            self.counters.record('update', comparisons=1, nodes_visited=1)
+        slot = self.index.get(name)
+        if slot is not None:
+            contact = self.slots[slot]
+            self._apply_update(contact, phone, email)
+            return True
+        return False
+    
+    def dead_ratio(self) -> float:
+        """Fraction of slots currently holding tombstones."""
+        return self._dead / len(self.slots) if self.slots else 0.0
+    
+    def size(self) -> int:
+        return len(self.index)
+    
+    def __iter__(self) -> Iterator[Contact]:
+        return (contact for contact in self.slots if contact is not None)
+
+# ==================== LINKED LIST IMPLEMENTATION ====================
+class ListNode:
+    """Node for singly linked list."""
+    
+    def __init__(self, contact: Contact):
+        self.contact = contact
+        self.next = None
+        self.count = 0  # Access count, used by the 'count' self-organizing policy
+
+# Self-organizing policies for LinkedListContacts (None keeps the static order)
+SELF_ORGANIZING_POLICIES = (None, 'move_to_front', 'transpose', 'count')
+
+class LinkedListContacts(ContactManager):
+    """Linked list-based contact management system.
+    
+    With a self-organizing ``policy`` each successful search or update reorders
+    the list so frequently accessed contacts drift towards the head:
+    'move_to_front' moves the hit to the head, 'transpose' swaps it with its
+    predecessor, and 'count' keeps nodes ordered by access count.
+    """
+    
+    def __init__(self, policy: Optional[str] = None):
+        if policy not in SELF_ORGANIZING_POLICIES:
+            raise ValueError(f"Unknown self-organizing policy: {policy!r}")
+        self.head = None
+        self._size = 0
+        self.policy = policy
+    
+    def insert(self, contact: Contact) -> None:
+        """Insert a new contact at the head. O(1) time complexity.
+        
+        Under the 'count' policy the new, never-accessed node goes after the
+        last node with a non-zero count instead, keeping the list ordered by
+        access count; that walk is O(k) in the number of accessed nodes.
+        """
+        new_node = ListNode(contact)
+        visited = 0
+        if self.policy == 'count' and self.head and self.head.count > 0:
+            node = self.head
+            visited = 1
+            while node.next and node.next.count > 0:
+                node = node.next
+                visited += 1
+            new_node.next = node.next
+            node.next = new_node
+        else:
+            new_node.next = self.head
+            self.head = new_node
+        if self.counters is not None:
+            self.counters.record('insert', nodes_visited=visited)
+        self._size += 1
+        if self._views:
+            self._notify_insert(contact)
+    
+    def _find(self, name: str, operation: str) -> Optional[Contact]:
+        hops = 0
+        current = self.head
+        while current:
+            hops += 1
+            if current.contact.name == name:
+                break
+            current = current.next
+        if self.counters is not None:
+            self.counters.record(operation, comparisons=hops, nodes_visited=hops)
+        return current.contact if current else None
+    
+    def _find_and_reorganize(self, name: str, operation: str) -> Optional[Contact]:
+        """Find name and apply the self-organizing policy to its node."""
+        hops = 0
+        before_prev = prev = None
+        current = self.head
+        while current:
+            hops += 1
+            if current.contact.name == name:
+                break
+            before_prev, prev, current = prev, current, current.next
+        
+        visited = hops
+        if current is not None:
+            current.count += 1
+            if prev is not None:  # Not already at the head
+                visited += self._reorganize(before_prev, prev, current)
+        if self.counters is not None:
+            # The 'count' reordering walk visits nodes but compares no names
+            self.counters.record(operation, comparisons=hops, nodes_visited=visited)
+        return current.contact if current else None
+    
+    def _reorganize(self, before_prev: Optional[ListNode], prev: ListNode,
+                    current: ListNode) -> int:
+        """Move the hit node per the policy. Returns the nodes walked to place it."""
+        if self.policy == 'move_to_front':
+            prev.next = current.next
+            current.next = self.head
+            self.head = current
+        elif self.policy == 'transpose':
+            prev.next = current.next
+            current.next = prev
+            if before_prev is None:
+                self.head = current
+            else:
+                before_prev.next = current
+        elif prev.count < current.count:  # 'count': move ahead of less-used nodes
+            prev.next = current.next
+            if self.head.count < current.count:
+                current.next = self.head
+                self.head = current
+            else:
+                node = self.head
+                walked = 1
+                while node.next.count >= current.count:
+                    node = node.next
+                    walked += 1
+                current.next = node.next
+                node.next = current
+                return walked
+        return 0
+    
+    def search(self, name: str) -> Optional[Contact]:
+        """Search for a contact by name. O(n) time complexity."""
+        if self.policy is not None:
+            return self._find_and_reorganize(name, 'search')
+        return self._find(name, 'search')
+    
+    def _record_delete(self, hops: int) -> None:
+        if self.counters is not None:
+            self.counters.record('delete', comparisons=hops, nodes_visited=hops)
+    
+    def delete(self, name: str) -> bool:
+        """Delete a contact by name. O(n) time complexity."""
+        if not self.head:
+            self._record_delete(0)
+            return False
+        
+        hops = 1
+        if self.head.contact.name == name:
+            removed = self.head.contact
+            self.head = self.head.next
+            self._size -= 1
+            self._record_delete(hops)
+            if self._views:
+                self._notify_delete(removed)
+            return True
+        
+        current = self.head
+        while current.next:
+            hops += 1
+            if current.next.contact.name == name:
+                removed = current.next.contact
+                current.next = current.next.next
+                self._size -= 1
+                self._record_delete(hops)
+                if self._views:
+                    self._notify_delete(removed)
+                return True
+            current = current.next
+        
+        self._record_delete(hops)
+        return False
+    
+    def update(self, name: str, phone: str = None, email: str = None) -> bool:
+        """Update a contact's information. O(n) time complexity."""
+        if self.policy is not None:
+            contact = self._find_and_reorganize(name, 'update')
+        else:
+            contact = self._find(name, 'update')
+        if contact:
+            self._apply_update(contact, phone, email)
+            return True
+        return False
+    
+    def size(self) -> int:
+        return self._size
+    
+    def __iter__(self) -> Iterator[Contact]:
+        current = self.head
+        while current:
+            yield current.contact
+            current = current.next
+
+# ==================== HASH MAP IMPLEMENTATION ====================
+class HashMapContacts(ContactManager):
+    """Hash map-based contact management system."""
+    
+    _unique_names = True
+    
+    def __init__(self):
+        self.contacts = {}
+    
+    def insert(self, contact: Contact) -> None:
+        """Insert a new contact. O(1) average time complexity."""
+        if self.counters is not None:
+            self.counters.record('insert', comparisons=1, nodes_visited=1)
+        if self._views:
+            replaced = self.contacts.get(contact.name)
+            if replaced is not None:
+                self._notify_delete(replaced)
+        self.contacts[contact.name] = contact
+        if self._views:
+            self._notify_insert(contact)
+    
+    def search(self, name: str) -> Optional[Contact]:
+        """Search for a contact by name. O(1) average time complexity."""
+        if self.counters is not None:
+            self.counters.record('search', comparisons=1, nodes_visited=1)
+        return self.contacts.get(name)
+    
+    def delete(self, name: str) -> bool:
+        """Delete a contact by name. O(1) average time complexity."""
+        if self.counters is not None:
+            self.counters.record('delete', comparisons=1, nodes_visited=1)
+        if name in self.contacts:
+            removed = self.contacts.pop(name)
+            if self._views:
+                self._notify_delete(removed)
+            return True
+        return False
+    
+    def update(self, name: str, phone: str = None, email: str = None) -> bool:
+        """Update a contact's information. O(1) average time complexity."""
+        if self.counters is not None:
+            self.counters.record('update', comparisons=1, nodes_visited=1)
+        contact = self.contacts.get(name)
+        if contact:
+            self._apply_update(contact, phone, email)
+            return True
+        return False
+    
+    def size(self) -> int:
+        return len(self.contacts)
+    
+    def __iter__(self) -> Iterator[Contact]:
+        return iter(self.contacts.values())
+
+# ==================== BINARY SEARCH TREE IMPLEMENTATION ====================
+class BSTNode:
+    """Node for binary search tree."""
+    
+    def __init__(self, contact: Contact):
+        self.contact = contact
+        self.left = None
+        self.right = None
+
+class BSTContacts(ContactManager):
+    """Binary search tree-based contact management system."""
+    
+    def __init__(self):
+        self.root = None
+        self._size = 0
+    
+    def insert(self, contact: Contact) -> None:
+        """Insert a new contact. O(log n) average, O(n) worst case."""
+        visited = 0
+        
+        def _insert(node, contact):
+            nonlocal visited
+            if not node:
+                return BSTNode(contact)
+            
+            visited += 1
+            if contact.name < node.contact.name:
+                node.left = _insert(node.left, contact)
+            else:
+                node.right = _insert(node.right, contact)
+            return node
+        
+        self.root = _insert(self.root, contact)
+        self._size += 1
+        if self.counters is not None:
+            self.counters.record('insert', comparisons=visited, nodes_visited=visited)
+        if self._views:
+            self._notify_insert(contact)
+    
+    def _find(self, name: str, operation: str) -> Optional[Contact]:
+        comparisons = visited = 0
+        
+        def _search(node, name):
+            nonlocal comparisons, visited
+            if not node:
+                return None
+            
+            visited += 1
+            comparisons += 1
+            if name == node.contact.name:
+                return node.contact
+            comparisons += 1
+            if name < node.contact.name:
+                return _search(node.left, name)
+            else:
+                return _search(node.right, name)
+        
+        contact = _search(self.root, name)
+        if self.counters is not None:
+            self.counters.record(operation, comparisons=comparisons, nodes_visited=visited)
+        return contact
+    
+    def search(self, name: str) -> Optional[Contact]:
+        """Search for a contact by name. O(log n) average, O(n) worst case."""
+        return self._find(name, 'search')
+    
+    def delete(self, name: str) -> bool:
+        """Delete a contact by name. O(log n) average, O(n) worst case."""
+        comparisons = visited = 0
+        
+        def _find_min(node):
+            nonlocal visited
+            visited += 1
+            while node.left:
+                node = node.left
+                visited += 1
+            return node
+        
+        removed = []
+        
+        def _delete(node, name):
+            nonlocal comparisons, visited
+            if not node:
+                return None, False
+            
+            visited += 1
+            comparisons += 1
+            deleted = False
+            if name < node.contact.name:
+                node.left, deleted = _delete(node.left, name)
+                return node, deleted
+            comparisons += 1
+            if name > node.contact.name:
+                node.right, deleted = _delete(node.right, name)
+            else:
+                deleted = True
+                if not removed:
+                    removed.append(node.contact)
+                if not node.left:
+                    return node.right, deleted
+                elif not node.right:
+                    return node.left, deleted
+                
+                # Node with two children: the successor is found, then deleted
+                # by a second descent of the right subtree
+                temp = _find_min(node.right)
+                node.contact = temp.contact
+                node.right, _ = _delete(node.right, temp.contact.name)
+            
+            return node, deleted
+        
+        self.root, deleted = _delete(self.root, name)
+        if self.counters is not None:
+            self.counters.record('delete', comparisons=comparisons, nodes_visited=visited)
+        if deleted:
+            self._size -= 1
+            if self._views:
+                self._notify_delete(removed[0])
+        return deleted
+    
+    def update(self, name: str, phone: str = None, email: str = None) -> bool:
+        """Update a contact's information. O(log n) average, O(n) worst case."""
+        contact = self._find(name, 'update')
+        if contact:
+            self._apply_update(contact, phone, email)
+            return True
+        return False
+    
+    def size(self) -> int:
+        return self._size
+    
+    def depth_distribution(self) -> Dict[int, int]:
+        """Number of nodes at each depth (root is depth 0). O(n)."""
+        distribution: Dict[int, int] = {}
+        level = [self.root] if self.root else []
+        depth = 0
+        while level:
+            distribution[depth] = len(level)
+            level = [child for node in level for child in (node.left, node.right) if child]
+            depth += 1
+        return distribution
+    
+    def height(self) -> int:
+        """Number of levels in the tree (0 when empty); equals size for a fully skewed tree.
+        
+        Computed on demand from depth_distribution(), so O(n) per call.
+        """
+        return len(self.depth_distribution())
+    
+    def __iter__(self) -> Iterator[Contact]:
+        """In-order traversal, yielding contacts sorted by name."""
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.contact
+            node = node.right
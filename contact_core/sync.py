@@ -0,0 +1,228 @@
+"""Merkle-hashed delta sync between two contact stores."""
+
+import hashlib
+from typing import Dict, Hashable, List, Tuple
+
+from .models import Contact, ContactManager
+
+_DIGEST_MODULUS = 1 << 256
+
+def contact_digest(contact: Contact) -> int:
+    """256-bit content hash of a contact's name, phone and email."""
+    data = '\0'.join((contact.name, contact.phone, contact.email)).encode('utf-8')
+    return int.from_bytes(hashlib.sha256(data).digest(), 'big')
+
+# ==================== MERKLE INDEX ====================
+class MerkleIndex:
+    """Hash tree over name-hash ranges of a ContactManager, kept current as a view.
+    
+    The name space is split into 2**depth leaf ranges by the leading bits of
+    sha256(name). A leaf's value is the sum of its contacts' digests modulo
+    2**256, so an insert, delete or update changes it in O(1) and identical
+    contacts still add up rather than cancelling out as they would under XOR;
+    only the depth hashes on the path to the root are then recomputed. The
+    digest and fields each contact was indexed with are recorded under the
+    manager's handle, so a delete takes back exactly what was added even if
+    the contact was changed behind this store's back, and every contact
+    stored under a name can be served to a peer.
+    """
+    
+    def __init__(self, manager: ContactManager, depth: int = 10):
+        if not 0 < depth <= 24:
+            raise ValueError("depth must be between 1 and 24")
+        self.manager = manager
+        self.depth = depth
+        # Per leaf: name -> (digest, phone, email) of each contact with that name
+        self.leaves: List[Dict[str, List[Tuple[int, str, str]]]] = [{} for _ in range(1 << depth)]
+        self._leaf_acc = [0] * (1 << depth)
+        # handle -> (name, record) per stored copy, as indexed
+        self._entries: Dict[Hashable, List[Tuple[str, Tuple[int, str, str]]]] = {}
+        empty = (0).to_bytes(32, 'big')
+        self.levels = [[empty] * (1 << level) for level in range(depth + 1)]
+        for level in range(depth - 1, -1, -1):
+            for i in range(1 << level):
+                self.levels[level][i] = self._combine(level, i)
+        manager.attach_view(self)
+    
+    def leaf_of(self, name: str) -> int:
+        prefix = int.from_bytes(hashlib.sha256(name.encode('utf-8')).digest()[:4], 'big')
+        return prefix >> (32 - self.depth)
+    
+    def _combine(self, level: int, index: int) -> bytes:
+        children = self.levels[level + 1]
+        return hashlib.sha256(children[2 * index] + children[2 * index + 1]).digest()
+    
+    def _adjust(self, leaf: int, delta: int) -> None:
+        self._leaf_acc[leaf] = (self._leaf_acc[leaf] + delta) % _DIGEST_MODULUS
+        self.levels[self.depth][leaf] = self._leaf_acc[leaf].to_bytes(32, 'big')
+        index = leaf
+        for level in range(self.depth - 1, -1, -1):
+            index //= 2
+            self.levels[level][index] = self._combine(level, index)
+    
+    def on_insert(self, handle: Hashable, contact: Contact) -> None:
+        record = (contact_digest(contact), contact.phone, contact.email)
+        leaf = self.leaf_of(contact.name)
+        self.leaves[leaf].setdefault(contact.name, []).append(record)
+        self._entries.setdefault(handle, []).append((contact.name, record))
+        self._adjust(leaf, record[0])
+    
+    def on_delete(self, handle: Hashable, contact: Contact) -> None:
+        records = self._entries.get(handle)
+        if not records:
+            return
+        name, record = records.pop()
+        if not records:
+            del self._entries[handle]
+        leaf = self.leaf_of(name)
+        entries = self.leaves[leaf][name]
+        entries.remove(record)
+        if not entries:
+            del self.leaves[leaf][name]
+        self._adjust(leaf, -record[0])
+    
+    def on_update(self, handle: Hashable, contact: Contact) -> None:
+        records = self._entries.get(handle, [])
+        new_record = (contact_digest(contact), contact.phone, contact.email)
+        for i, (name, record) in enumerate(records):
+            if record == new_record:
+                continue
+            leaf = self.leaf_of(name)
+            entries = self.leaves[leaf][name]
+            entries[entries.index(record)] = new_record
+            records[i] = (name, new_record)
+            self._adjust(leaf, new_record[0] - record[0])
+    
+    def root_hash(self) -> bytes:
+        return self.levels[0][0]
+    
+    def node_hashes(self, level: int, indices: List[int]) -> List[bytes]:
+        nodes = self.levels[level]
+        return [nodes[i] for i in indices]
+    
+    def leaf_digests(self, leaf: int) -> Dict[str, int]:
+        """name -> digest for one leaf range (same-name contacts are summed mod 2**256)."""
+        return {name: sum(entry[0] for entry in entries) % _DIGEST_MODULUS
+                for name, entries in self.leaves[leaf].items()}
+    
+    def contacts(self, names: List[str]) -> List[Contact]:
+        """Every indexed contact stored under one of the names, as new Contact objects."""
+        return [Contact(name, phone, email)
+                for name in set(names)
+                for _, phone, email in self.leaves[self.leaf_of(name)].get(name, ())]
+
+# ==================== PEERS ====================
+class LocalPeer:
+    """In-process stand-in for a remote replica's MerkleIndex.
+    
+    Contacts are returned as copies, as they would be after crossing the
+    wire, and every request is counted so a sync's traffic can be inspected.
+    """
+    
+    def __init__(self, index: MerkleIndex):
+        self.index = index
+        self.depth = index.depth
+        self.requests = 0
+        self.hashes_sent = 0
+        self.contacts_sent = 0
+    
+    def root_hash(self) -> bytes:
+        self.requests += 1
+        self.hashes_sent += 1
+        return self.index.root_hash()
+    
+    def node_hashes(self, level: int, indices: List[int]) -> List[bytes]:
+        self.requests += 1
+        self.hashes_sent += len(indices)
+        return self.index.node_hashes(level, indices)
+    
+    def leaf_digests(self, leaves: List[int]) -> Dict[int, Dict[str, int]]:
+        self.requests += 1
+        result = {leaf: self.index.leaf_digests(leaf) for leaf in leaves}
+        self.hashes_sent += sum(len(digests) for digests in result.values())
+        return result
+    
+    def fetch(self, names: List[str]) -> List[Contact]:
+        self.requests += 1
+        contacts = self.index.contacts(names)
+        self.contacts_sent += len(contacts)
+        return contacts
+
+# ==================== SYNC ENGINE ====================
+class SyncDelta:
+    """Names that differ between a local store and a remote peer."""
+    
+    def __init__(self, missing_local: List[str], missing_remote: List[str],
+                 conflicting: List[str]):
+        self.missing_local = missing_local    # Only on the remote
+        self.missing_remote = missing_remote  # Only on the local store
+        self.conflicting = conflicting        # On both, with different content
+    
+    def is_empty(self) -> bool:
+        return not (self.missing_local or self.missing_remote or self.conflicting)
+    
+    def __repr__(self):
+        return (f"SyncDelta(missing_local={len(self.missing_local)}, "
+                f"missing_remote={len(self.missing_remote)}, "
+                f"conflicting={len(self.conflicting)})")
+
+class MerkleSync:
+    """Computes and applies the delta between a local MerkleIndex and a peer.
+    
+    diff() descends both trees level by level, asking the peer only for the
+    child hashes of nodes that differ, and compares per-contact digests only
+    in the leaf ranges that still differ at the bottom.
+    """
+    
+    def __init__(self, local: MerkleIndex, peer):
+        if local.depth != peer.depth:
+            raise ValueError("local and remote Merkle trees must have the same depth")
+        self.local = local
+        self.peer = peer
+    
+    def diff(self) -> SyncDelta:
+        if self.peer.root_hash() == self.local.root_hash():
+            return SyncDelta([], [], [])
+        
+        differing = [0]
+        for level in range(1, self.local.depth + 1):
+            children = [child for index in differing for child in (2 * index, 2 * index + 1)]
+            remote = self.peer.node_hashes(level, children)
+            local = self.local.node_hashes(level, children)
+            differing = [child for child, r, l in zip(children, remote, local) if r != l]
+            if not differing:
+                break
+        
+        missing_local, missing_remote, conflicting = [], [], []
+        for leaf, remote_digests in self.peer.leaf_digests(differing).items():
+            local_digests = self.local.leaf_digests(leaf)
+            for name, digest in remote_digests.items():
+                if name not in local_digests:
+                    missing_local.append(name)
+                elif local_digests[name] != digest:
+                    conflicting.append(name)
+            missing_remote.extend(name for name in local_digests if name not in remote_digests)
+        return SyncDelta(missing_local, missing_remote, conflicting)
+    
+    def pull(self, mirror: bool = False) -> SyncDelta:
+        """Bring the local store up to date with the peer.
+        
+        Remote-only and conflicting names are fetched in one request, with
+        every remote contact stored under each name, and applied with a batch
+        insert; a conflicting name's local contacts are all replaced. With
+        mirror=True contacts that exist only locally are deleted too. A store
+        that keeps one contact per name (HashMapContacts, IndexedArrayContacts,
+        TieredContacts) cannot converge with a peer holding duplicate names.
+        """
+        delta = self.diff()
+        manager = self.local.manager
+        if delta.missing_local or delta.conflicting:
+            for name in delta.conflicting:
+                while manager.delete(name):
+                    pass
+            manager.insert_many(self.peer.fetch(delta.missing_local + delta.conflicting))
+        if mirror:
+            for name in delta.missing_remote:
+                while manager.delete(name):
+                    pass
+        return delta
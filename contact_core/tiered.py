@@ -0,0 +1,260 @@
+"""Tiered hot/cold contact storage with a bounded memory budget."""
+
+import os
+import struct
+import sys
+import tempfile
+import weakref
+from collections import OrderedDict
+from typing import Dict, Iterator, Optional, Tuple
+
+from .models import Contact, ContactManager
+from .structures import HashMapContacts
+
+_OBJECT_OVERHEAD = sys.getsizeof(Contact('', '', ''))
+_LENGTH_PREFIX = struct.Struct('<I')
+
+def contact_bytes(contact: Contact) -> int:
+    """Approximate in-memory footprint of a contact: object, attribute dict and strings."""
+    return (_OBJECT_OVERHEAD + sys.getsizeof(contact.__dict__) + sys.getsizeof(contact.name) +
+            sys.getsizeof(contact.phone) + sys.getsizeof(contact.email))
+
+# ==================== COLD STORE ====================
+def _close_and_remove(file, path: str) -> None:
+    file.close()
+    if os.path.exists(path):
+        os.remove(path)
+
+class ColdStore:
+    """Append-only on-disk key-value file of contacts with an in-memory index.
+    
+    Each record is a 4-byte length followed by the name, phone and email, each
+    stored as a 4-byte length and its UTF-8 bytes, so fields may hold any
+    character. The index maps a name to its record's (offset, length). Deleted
+    and overwritten records become dead space, and the file is rewritten once
+    dead bytes exceed live bytes. The file is removed by close() or, failing
+    that, when the store is garbage collected.
+    """
+    
+    def __init__(self, path: Optional[str] = None):
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix='contacts-cold-', suffix='.dat')
+            os.close(fd)
+        self.path = path
+        self.file = open(path, 'w+b')
+        self._finalizer = weakref.finalize(self, _close_and_remove, self.file, path)
+        self.index: Dict[str, Tuple[int, int]] = {}
+        self.live_bytes = 0
+        self.dead_bytes = 0
+        self.reads = 0
+        self.writes = 0
+    
+    @staticmethod
+    def _encode(contact: Contact) -> bytes:
+        fields = [field.encode('utf-8') for field in (contact.name, contact.phone, contact.email)]
+        data = b''.join(_LENGTH_PREFIX.pack(len(field)) + field for field in fields)
+        return _LENGTH_PREFIX.pack(len(data)) + data
+    
+    @staticmethod
+    def _decode(data: bytes) -> Contact:
+        fields = []
+        pos = 0
+        while pos < len(data):
+            (length,) = _LENGTH_PREFIX.unpack_from(data, pos)
+            pos += _LENGTH_PREFIX.size
+            fields.append(data[pos:pos + length].decode('utf-8'))
+            pos += length
+        return Contact(*fields)
+    
+    def put(self, contact: Contact) -> None:
+        self.delete(contact.name)
+        record = self._encode(contact)
+        self.file.seek(0, os.SEEK_END)
+        offset = self.file.tell()
+        self.file.write(record)
+        self.index[contact.name] = (offset, len(record))
+        self.live_bytes += len(record)
+        self.writes += 1
+    
+    def get(self, name: str) -> Optional[Contact]:
+        location = self.index.get(name)
+        if location is None:
+            return None
+        offset, length = location
+        self.file.seek(offset + _LENGTH_PREFIX.size)
+        data = self.file.read(length - _LENGTH_PREFIX.size)
+        self.reads += 1
+        return self._decode(data)
+    
+    def delete(self, name: str) -> bool:
+        location = self.index.pop(name, None)
+        if location is None:
+            return False
+        self.live_bytes -= location[1]
+        self.dead_bytes += location[1]
+        if self.dead_bytes > self.live_bytes:
+            self.compact()
+        return True
+    
+    def compact(self) -> None:
+        """Rewrite the file with only the live records."""
+        contacts = [self.get(name) for name in list(self.index)]
+        self.file.seek(0)
+        self.file.truncate()
+        self.index.clear()
+        self.live_bytes = self.dead_bytes = 0
+        for contact in contacts:
+            self.put(contact)
+    
+    def index_bytes(self) -> int:
+        """Approximate in-memory footprint of the name index. O(n) in its entries."""
+        return sys.getsizeof(self.index) + sum(
+            sys.getsizeof(name) + sys.getsizeof(location) + sys.getsizeof(location[0]) +
+            sys.getsizeof(location[1]) for name, location in self.index.items())
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+    
+    def __len__(self) -> int:
+        return len(self.index)
+    
+    def __iter__(self) -> Iterator[Contact]:
+        for name in list(self.index):
+            yield self.get(name)
+    
+    def close(self, remove: bool = True) -> None:
+        if remove:
+            self._finalizer()
+        else:
+            self._finalizer.detach()
+            self.file.close()
+
+# ==================== TIERED CONTACT MANAGER ====================
+class TieredContacts(ContactManager):
+    """Hot contacts in a HashMapContacts, cold ones spilled to a ColdStore.
+    
+    The hot tier never holds more than ``memory_budget`` bytes (as estimated
+    by contact_bytes): the least recently used contacts are evicted to disk
+    before a contact is admitted, and a contact larger than the whole budget
+    is only ever kept cold. A cold contact is promoted back to the hot tier
+    when it is accessed. Like
+    HashMapContacts, inserting an existing name replaces that contact. The
+    cold store's name index stays in memory outside the budget and grows O(n)
+    with the cold contacts (see ColdStore.index_bytes), so the budget bounds
+    the hot contacts, not the process.
+    """
+    
+    _unique_names = True
+    
+    def __init__(self, memory_budget: int, path: Optional[str] = None):
+        if memory_budget <= 0:
+            raise ValueError("memory_budget must be positive")
+        self.memory_budget = memory_budget
+        self.hot = HashMapContacts()
+        self.cold = ColdStore(path)
+        self._lru: 'OrderedDict[str, int]' = OrderedDict()  # name -> bytes, oldest first
+        self.hot_bytes = 0
+        self.peak_hot_bytes = 0
+        self.hot_hits = 0
+        self.cold_hits = 0
+        self.misses = 0
+    
+    def _admit(self, contact: Contact) -> None:
+        """Evict until contact fits the budget, then place it in the hot tier."""
+        nbytes = contact_bytes(contact)
+        if nbytes > self.memory_budget:
+            self.cold.put(contact)
+            return
+        while self.hot_bytes + nbytes > self.memory_budget:
+            name, evicted_bytes = self._lru.popitem(last=False)
+            self.cold.put(self.hot.search(name))
+            self.hot.delete(name)
+            self.hot_bytes -= evicted_bytes
+        self.hot.insert(contact)
+        self._lru[contact.name] = nbytes
+        self.hot_bytes += nbytes
+        self.peak_hot_bytes = max(self.peak_hot_bytes, self.hot_bytes)
+    
+    def _drop_hot(self, name: str) -> Optional[Contact]:
+        contact = self.hot.search(name)
+        if contact is not None:
+            self.hot.delete(name)
+            self.hot_bytes -= self._lru.pop(name)
+        return contact
+    
+    def _lookup(self, name: str) -> Optional[Contact]:
+        contact = self.hot.search(name)
+        if contact is not None:
+            self.hot_hits += 1
+            self._lru.move_to_end(name)
+            return contact
+        contact = self.cold.get(name)
+        if contact is None:
+            self.misses += 1
+            return None
+        self.cold_hits += 1
+        self.cold.delete(name)
+        self._admit(contact)
+        return contact
+    
+    def insert(self, contact: Contact) -> None:
+        """Insert a new contact into the hot tier. O(1) amortized plus evictions."""
+        replaced = self._drop_hot(contact.name)
+        if replaced is None and contact.name in self.cold:
+            replaced = self.cold.get(contact.name)
+            self.cold.delete(contact.name)
+        self._admit(contact)
+        if self._views:
+            if replaced is not None:
+                self._notify_delete(replaced)
+            self._notify_insert(contact)
+    
+    def search(self, name: str) -> Optional[Contact]:
+        """Search for a contact by name, promoting it if it was cold."""
+        return self._lookup(name)
+    
+    def delete(self, name: str) -> bool:
+        """Delete a contact from whichever tier holds it."""
+        removed = self._drop_hot(name)
+        if removed is None:
+            removed = self.cold.get(name)
+            if removed is None:
+                return False
+            self.cold.delete(name)
+        if self._views:
+            self._notify_delete(removed)
+        return True
+    
+    def update(self, name: str, phone: str = None, email: str = None) -> bool:
+        """Update a contact's information, promoting it if it was cold."""
+        contact = self._lookup(name)
+        if contact:
+            self._apply_update(contact, phone, email)
+            # Field sizes may have changed; re-account the contact
+            if self._drop_hot(name) is None:
+                self.cold.delete(name)  # Too large for the hot tier: drop the stale copy
+            self._admit(contact)
+            return True
+        return False
+    
+    def hit_rate(self) -> float:
+        """Fraction of successful lookups served from the hot tier."""
+        hits = self.hot_hits + self.cold_hits
+        return self.hot_hits / hits if hits else 0.0
+    
+    def size(self) -> int:
+        return self.hot.size() + len(self.cold)
+    
+    def __iter__(self) -> Iterator[Contact]:
+        yield from list(self.hot)
+        yield from self.cold
+    
+    def close(self) -> None:
+        """Close and remove the cold-tier file."""
+        self.cold.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
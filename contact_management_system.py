@@ -1,339 +1,47 @@
 # Contact Management System - Data Structure Performance Comparison
-# Complete implementation with all data structures and performance testing
+# Benchmarking and reporting layer; the data structures live in contact_core.
+# pandas/matplotlib/seaborn are imported only when a report or plot is made.
 
 import time
 import random
-import string
-import matplotlib.pyplot as plt
-import seaborn as sns
-import pandas as pd
-from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+import math
+import itertools
+import os
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, TYPE_CHECKING
 import gc
+import tracemalloc
 
-# ==================== CONTACT CLASS ====================
-class Contact:
-    """Represents a contact with name, phone, and email."""
-    
-    def __init__(self, name: str, phone: str, email: str):
-        self.name = name
-        self.phone = phone
-        self.email = email
-    
-    def __repr__(self):
-        return f"Contact('{self.name}', '{self.phone}', '{self.email}')"
-    
-    def __str__(self):
-        return f"{self.name} | {self.phone} | {self.email}"
-
-# ==================== ABSTRACT BASE CLASS ====================
-class ContactManager(ABC):
-    """Abstract base class for all contact management implementations."""
-    
-    @abstractmethod
-    def insert(self, contact: Contact) -> None:
-        pass
-    
-    @abstractmethod
-    def search(self, name: str) -> Optional[Contact]:
-        pass
-    
-    @abstractmethod
-    def delete(self, name: str) -> bool:
-        pass
-    
-    @abstractmethod
-    def update(self, name: str, phone: str = None, email: str = None) -> bool:
-        pass
-    
-    @abstractmethod
-    def size(self) -> int:
-        pass
-
-# ==================== ARRAY-BASED IMPLEMENTATION ====================
-class ArrayContacts(ContactManager):
-    """Array-based contact management system."""
-    
-    def __init__(self):
-        self.contacts = []
-    
-    def insert(self, contact: Contact) -> None:
-        """Insert a new contact. O(1) amortized time complexity."""
-        self.contacts.append(contact)
-    
-    def search(self, name: str) -> Optional[Contact]:
-        """Search for a contact by name. O(n) time complexity."""
-        for contact in self.contacts:
-            if contact.name == name:
-                return contact
-        return None
-    
-    def delete(self, name: str) -> bool:
-        """Delete a contact by name. O(n) time complexity."""
-        for i, contact in enumerate(self.contacts):
-            if contact.name == name:
-                self.contacts.pop(i)
-                return True
-        return False
-    
-    def update(self, name: str, phone: str = None, email: str = None) -> bool:
-        """Update a contact's information. O(n) time complexity."""
-        contact = self.search(name)
-        if contact:
-            if phone:
-                contact.phone = phone
-            if email:
-                contact.email = email
-            return True
-        return False
-    
-    def size(self) -> int:
-        return len(self.contacts)
-
-# ==================== LINKED LIST IMPLEMENTATION ====================
-class ListNode:
-    """Node for singly linked list."""
-    
-    def __init__(self, contact: Contact):
-        self.contact = contact
-        self.next = None
-
-class LinkedListContacts(ContactManager):
-    """Linked list-based contact management system."""
-    
-    def __init__(self):
-        self.head = None
-        self._size = 0
-    
-    def insert(self, contact: Contact) -> None:
-        """Insert a new contact at the head. O(1) time complexity."""
-        new_node = ListNode(contact)
-        new_node.next = self.head
-        self.head = new_node
-        self._size += 1
-    
-    def search(self, name: str) -> Optional[Contact]:
-        """Search for a contact by name. O(n) time complexity."""
-        current = self.head
-        while current:
-            if current.contact.name == name:
-                return current.contact
-            current = current.next
-        return None
-    
-    def delete(self, name: str) -> bool:
-        """Delete a contact by name. O(n) time complexity."""
-        if not self.head:
-            return False
-        
-        if self.head.contact.name == name:
-            self.head = self.head.next
-            self._size -= 1
-            return True
-        
-        current = self.head
-        while current.next:
-            if current.next.contact.name == name:
-                current.next = current.next.next
-                self._size -= 1
-                return True
-            current = current.next
-        
-        return False
-    
-    def update(self, name: str, phone: str = None, email: str = None) -> bool:
-        """Update a contact's information. O(n) time complexity."""
-        contact = self.search(name)
-        if contact:
-            if phone:
-                contact.phone = phone
-            if email:
-                contact.email = email
-            return True
-        return False
-    
-    def size(self) -> int:
-        return self._size
-
-# ==================== HASH MAP IMPLEMENTATION ====================
-class HashMapContacts(ContactManager):
-    """Hash map-based contact management system."""
-    
-    def __init__(self):
-        self.contacts = {}
-    
-    def insert(self, contact: Contact) -> None:
-        """Insert a new contact. O(1) average time complexity."""
-        self.contacts[contact.name] = contact
-    
-    def search(self, name: str) -> Optional[Contact]:
-        """Search for a contact by name. O(1) average time complexity."""
-        return self.contacts.get(name)
-    
-    def delete(self, name: str) -> bool:
-        """Delete a contact by name. O(1) average time complexity."""
-        if name in self.contacts:
-            del self.contacts[name]
-            return True
-        return False
-    
-    def update(self, name: str, phone: str = None, email: str = None) -> bool:
-        """Update a contact's information. O(1) average time complexity."""
-        contact = self.search(name)
-        if contact:
-            if phone:
-                contact.phone = phone
-            if email:
-                contact.email = email
-            return True
-        return False
-    
-    def size(self) -> int:
-        return len(self.contacts)
-
-# ==================== BINARY SEARCH TREE IMPLEMENTATION ====================
-class BSTNode:
-    """Node for binary search tree."""
-    
-    def __init__(self, contact: Contact):
-        self.contact = contact
-        self.left = None
-        self.right = None
+from contact_core import *  # noqa: F401,F403 - re-exported for existing callers
+from contact_core import (
+    Contact,
+    ArrayContacts,
+    IndexedArrayContacts,
+    LinkedListContacts,
+    HashMapContacts,
+    BSTContacts,
+    BloomGuardedContacts,
+    TieredContacts,
+    DataGenerator,
+    contact_bytes,
+    SELF_ORGANIZING_POLICIES,
+)
 
-class BSTContacts(ContactManager):
-    """Binary search tree-based contact management system."""
-    
-    def __init__(self):
-        self.root = None
-        self._size = 0
-    
-    def insert(self, contact: Contact) -> None:
-        """Insert a new contact. O(log n) average, O(n) worst case."""
-        def _insert(node, contact):
-            if not node:
-                return BSTNode(contact)
-            
-            if contact.name < node.contact.name:
-                node.left = _insert(node.left, contact)
-            else:
-                node.right = _insert(node.right, contact)
-            return node
-        
-        self.root = _insert(self.root, contact)
-        self._size += 1
-    
-    def search(self, name: str) -> Optional[Contact]:
-        """Search for a contact by name. O(log n) average, O(n) worst case."""
-        def _search(node, name):
-            if not node:
-                return None
-            
-            if name == node.contact.name:
-                return node.contact
-            elif name < node.contact.name:
-                return _search(node.left, name)
-            else:
-                return _search(node.right, name)
-        
-        return _search(self.root, name)
-    
-    def delete(self, name: str) -> bool:
-        """Delete a contact by name. O(log n) average, O(n) worst case."""
-        def _find_min(node):
-            while node.left:
-                node = node.left
-            return node
-        
-        def _delete(node, name):
-            if not node:
-                return None, False
-            
-            deleted = False
-            if name < node.contact.name:
-                node.left, deleted = _delete(node.left, name)
-            elif name > node.contact.name:
-                node.right, deleted = _delete(node.right, name)
-            else:
-                deleted = True
-                if not node.left:
-                    return node.right, deleted
-                elif not node.right:
-                    return node.left, deleted
-                
-                # Node with two children
-                temp = _find_min(node.right)
-                node.contact = temp.contact
-                node.right, _ = _delete(node.right, temp.contact.name)
-            
-            return node, deleted
-        
-        self.root, deleted = _delete(self.root, name)
-        if deleted:
-            self._size -= 1
-        return deleted
-    
-    def update(self, name: str, phone: str = None, email: str = None) -> bool:
-        """Update a contact's information. O(log n) average, O(n) worst case."""
-        contact = self.search(name)
-        if contact:
-            if phone:
-                contact.phone = phone
-            if email:
-                contact.email = email
-            return True
-        return False
-    
-    def size(self) -> int:
-        return self._size
-
-# ==================== UTILITY FUNCTIONS ====================
-class DataGenerator:
-    """Utility class for generating test data."""
-    
-    @staticmethod
-    def random_name(length: int = 8) -> str:
-        """Generate a random name."""
-        return ''.join(random.choices(string.ascii_letters, k=length)).title()
-    
-    @staticmethod
-    def random_phone() -> str:
-        """Generate a random phone number."""
-        return ''.join(random.choices(string.digits, k=10))
-    
-    @staticmethod
-    def random_email(name: str) -> str:
-        """Generate a random email based on name."""
-        domains = ['gmail.com', 'yahoo.com', 'hotmail.com', 'example.com']
-        return f"{name.lower()}@{random.choice(domains)}"
-    
-    @staticmethod
-    def generate_contacts(n: int) -> List[Contact]:
-        """Generate n random contacts."""
-        contacts = []
-        names_used = set()
-        
-        for _ in range(n):
-            # Ensure unique names
-            while True:
-                name = DataGenerator.random_name()
-                if name not in names_used:
-                    names_used.add(name)
-                    break
-            
-            phone = DataGenerator.random_phone()
-            email = DataGenerator.random_email(name)
-            contacts.append(Contact(name, phone, email))
-        
-        return contacts
+if TYPE_CHECKING:
+    import pandas as pd
 
 # ==================== PERFORMANCE TESTING ====================
 class PerformanceTester:
     """Class for testing and comparing performance of different data structures."""
     
-    def __init__(self):
+    def __init__(self, count_work: bool = True):
         self.results = []
+        self.count_work = count_work
         self.structures = {
             'Array': ArrayContacts,
+            'IndexedArray': IndexedArrayContacts,
             'LinkedList': LinkedListContacts,
             'HashMap': HashMapContacts,
             'BST': BSTContacts
@@ -355,8 +63,54 @@ class PerformanceTester:
         
         return mean_time / 1_000_000, spread / 1_000_000  # Convert to milliseconds
     
-    def test_operations(self, data_sizes: List[int], trials: int = 3):
-        """Test all operations for all data structures with different data sizes."""
+    def measure_work(self, structure_class, contacts: List[Contact],
+                     search_names: List[str]) -> dict:
+        """Replay the benchmark workload on an instrumented structure (untimed).
+        
+        Returns per-operation averages of key comparisons, nodes visited and
+        element shifts, plus tree height and mean node depth for backends that
+        expose depth_distribution() (None otherwise).
+        """
+        structure = structure_class()
+        counters = structure.enable_instrumentation()
+        for contact in contacts:
+            structure.insert(contact)
+        for name in search_names:
+            structure.search(name)
+        
+        # Shape is measured on the fully built structure, before deletes
+        height = mean_depth = None
+        if hasattr(structure, 'depth_distribution'):
+            distribution = structure.depth_distribution()
+            height = len(distribution)
+            nodes = sum(distribution.values())
+            if nodes:
+                mean_depth = sum(d * n for d, n in distribution.items()) / nodes
+        
+        # update() without new values still does the lookup but leaves the
+        # Contact objects (shared with the timed runs) untouched
+        for name in search_names[:10]:
+            structure.update(name)
+        for name in search_names[:10]:
+            structure.delete(name)
+        
+        return {
+            'Insert_Comparisons': counters.average('insert', 'comparisons'),
+            'Search_Comparisons': counters.average('search', 'comparisons'),
+            'Search_Nodes_Visited': counters.average('search', 'nodes_visited'),
+            'Update_Comparisons': counters.average('update', 'comparisons'),
+            'Delete_Comparisons': counters.average('delete', 'comparisons'),
+            'Delete_Shifts': counters.average('delete', 'shifts'),
+            'Tree_Height': height,
+            'Mean_Depth': mean_depth,
+        }
+    
+    def test_operations(self, data_sizes: List[int], trials: int = 3, seed: int = 42):
+        """Test all operations for all data structures with different data sizes.
+        
+        Each size's contacts come from random.Random(seed + size), the same
+        data run_benchmark_cell generates for the parallel runner.
+        """
         print("Starting Performance Tests...")
         print("=" * 60)
         
@@ -365,7 +119,7 @@ class PerformanceTester:
             print("-" * 40)
             
             # Generate test data
-            contacts = DataGenerator.generate_contacts(size)
+            contacts = DataGenerator.generate_contacts(size, random.Random(seed + size))
             search_names = [contact.name for contact in contacts[:min(100, size)]]
             
             for structure_name, structure_class in self.structures.items():
@@ -423,12 +177,224 @@ class PerformanceTester:
                     'Delete_Spread': delete_spread / 10
                 }
                 
+                if self.count_work:
+                    result.update(self.measure_work(structure_class, contacts, search_names))
+                
                 self.results.append(result)
                 
                 print(f"  Insert: {insert_time:.3f}ms ±{insert_spread:.3f}ms")
                 print(f"  Search (avg): {result['Search_Time_ms']:.6f}ms ±{result['Search_Spread']:.6f}ms")
                 print(f"  Update (avg): {result['Update_Time_ms']:.3f}ms ±{result['Update_Spread']:.3f}ms")
                 print(f"  Delete (avg): {result['Delete_Time_ms']:.3f}ms ±{result['Delete_Spread']:.3f}ms")
+                if self.count_work:
+                    self.print_work(result)
+    
+    @staticmethod
+    def print_work(result: dict) -> None:
+        """Print the algorithmic work counters of one result row."""
+        line = (f"  Work: {result['Search_Comparisons']:.1f} cmp/search, "
+                f"{result['Delete_Shifts']:.1f} shifts/delete")
+        if result['Tree_Height'] is not None:
+            line += f", height {result['Tree_Height']}, mean depth {result['Mean_Depth']:.1f}"
+        print(line)
+    
+    @staticmethod
+    def zipf_lookups(names: List[str], count: int, s: float = 1.0,
+                     rng: Optional[random.Random] = None) -> List[str]:
+        """Draw count names with Zipfian popularity (rank r has weight 1/r^s).
+        
+        Ranks are assigned to a shuffled copy of names so the popular contacts
+        are not simply the ones inserted first or last.
+        """
+        rng = rng or random.Random()
+        ranked = list(names)
+        rng.shuffle(ranked)
+        cum_weights = list(itertools.accumulate(1 / rank ** s for rank in range(1, len(ranked) + 1)))
+        return rng.choices(ranked, cum_weights=cum_weights, k=count)
+    
+    def test_skewed_access(self, size: int = 5000, lookups: int = 20000, zipf_s: float = 1.0,
+                           trials: int = 3, seed: int = 42) -> List[dict]:
+        """Compare the static linked list with each self-organizing policy under
+        Zipfian lookups, reporting average node hops and latency per search."""
+        print(f"\nSkewed Access Test ({size:,} contacts, {lookups:,} Zipf(s={zipf_s}) lookups)")
+        print("-" * 60)
+        
+        rng = random.Random(seed)
+        contacts = DataGenerator.generate_contacts(size, rng)
+        lookup_names = self.zipf_lookups([c.name for c in contacts], lookups, zipf_s, rng)
+        
+        def build(policy):
+            structure = LinkedListContacts(policy)
+            for contact in contacts:
+                structure.insert(contact)
+            return structure
+        
+        rows = []
+        for policy in SELF_ORGANIZING_POLICIES:
+            # Untimed instrumented pass for the hop count
+            structure = build(policy)
+            counters = structure.enable_instrumentation()
+            for name in lookup_names:
+                structure.search(name)
+            hops = counters.average('search', 'nodes_visited')
+            
+            # Each trial starts from the original insertion order
+            times = []
+            for _ in range(trials):
+                structure = build(policy)
+                gc.collect()
+                start_time = time.perf_counter_ns()
+                for name in lookup_names:
+                    structure.search(name)
+                times.append(time.perf_counter_ns() - start_time)
+            latency = sum(times) / len(times) / lookups / 1_000_000
+            
+            rows.append({
+                'Policy': policy or 'static',
+                'Size': size,
+                'Zipf_s': zipf_s,
+                'Avg_Hops': hops,
+                'Search_Time_ms': latency,
+            })
+        
+        static = rows[0]
+        for row in rows:
+            print(f"  {row['Policy']:<14} {row['Avg_Hops']:10.1f} hops  "
+                  f"{row['Search_Time_ms']:.6f}ms/search  "
+                  f"({static['Avg_Hops'] / row['Avg_Hops']:.1f}x fewer hops than static)")
+        return rows
+    
+    def test_miss_heavy(self, size: int = 5000, lookups: int = 2000, miss_ratio: float = 0.9,
+                        false_positive_rate: float = 0.01, trials: int = 3,
+                        seed: int = 42) -> List[dict]:
+        """Time searches where most names are absent, with and without a Bloom guard."""
+        print(f"\nMiss-Heavy Lookup Test ({size:,} contacts, {miss_ratio:.0%} misses, "
+              f"target FP rate {false_positive_rate})")
+        print("-" * 60)
+        
+        rng = random.Random(seed)
+        contacts = DataGenerator.generate_contacts(size, rng)
+        present = [contact.name for contact in contacts]
+        # Generated names are title-case letters, so digits guarantee a miss
+        absent = [f"Missing{i}" for i in range(lookups)]
+        lookup_names = [rng.choice(absent) if rng.random() < miss_ratio
+                        else rng.choice(present) for _ in range(lookups)]
+        
+        rows = []
+        for structure_name, structure_class in self.structures.items():
+            backend = structure_class()
+            for contact in contacts:
+                backend.insert(contact)
+            guarded = BloomGuardedContacts(backend, capacity=size,
+                                           false_positive_rate=false_positive_rate)
+            
+            def lookup_all(target):
+                def run():
+                    for name in lookup_names:
+                        target.search(name)
+                return run
+            
+            plain_time, _ = self.time_operation(lookup_all(backend), trials)
+            guarded_time, _ = self.time_operation(lookup_all(guarded), trials)
+            
+            rows.append({
+                'Structure': structure_name,
+                'Size': size,
+                'Miss_Ratio': miss_ratio,
+                'Plain_Search_ms': plain_time / lookups,
+                'Guarded_Search_ms': guarded_time / lookups,
+                'Observed_FP_Rate': guarded.observed_false_positive_rate(),
+            })
+            row = rows[-1]
+            print(f"  {structure_name:<12} plain {row['Plain_Search_ms']:.6f}ms  "
+                  f"guarded {row['Guarded_Search_ms']:.6f}ms  "
+                  f"({row['Plain_Search_ms'] / row['Guarded_Search_ms']:.1f}x)  "
+                  f"FP rate {row['Observed_FP_Rate']:.4f}")
+        return rows
+    
+    def test_tiered(self, size: int = 10000, budget_fractions: tuple = (0.1, 0.25, 0.5, 1.0),
+                    lookups: int = 20000, zipf_s: float = 1.0, seed: int = 42) -> List[dict]:
+        """Benchmark TieredContacts at several hot-tier memory budgets.
+        
+        Budgets are fractions of the estimated in-memory size of all contacts.
+        Reports the estimated hot-tier peak next to the real peak allocation
+        traced while loading and querying the store (which also covers the
+        cold-tier index and LRU bookkeeping), the estimated size of the cold
+        index on its own, which grows O(n) with the cold contacts whatever the
+        budget, plus the hot hit rate under Zipfian lookups and the resulting
+        latency, next to an all-in-memory HashMap. Memory is traced in a
+        separate run so it does not slow the timed lookups.
+        """
+        print(f"\nTiered Storage Test ({size:,} contacts, {lookups:,} Zipf(s={zipf_s}) lookups)")
+        print("-" * 60)
+        
+        rng = random.Random(seed)
+        contacts = DataGenerator.generate_contacts(size, rng)
+        lookup_names = self.zipf_lookups([c.name for c in contacts], lookups, zipf_s, rng)
+        total_bytes = sum(contact_bytes(contact) for contact in contacts)
+        
+        def load(structure) -> None:
+            # Fresh strings, as if read from an import file, so each store owns its data
+            for contact in contacts:
+                structure.insert(Contact(*(field.encode().decode() for field in
+                                           (contact.name, contact.phone, contact.email))))
+        
+        def traced_peak(structure) -> int:
+            gc.collect()
+            tracemalloc.start()
+            try:
+                load(structure)
+                for name in lookup_names:
+                    structure.search(name)
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+        
+        def timed_lookups(structure) -> float:
+            gc.collect()
+            start_time = time.perf_counter_ns()
+            for name in lookup_names:
+                structure.search(name)
+            return (time.perf_counter_ns() - start_time) / lookups / 1_000_000
+        
+        baseline = HashMapContacts()
+        load(baseline)
+        rows = [{
+            'Structure': 'HashMap',
+            'Budget_Fraction': 1.0,
+            'Budget_Bytes': total_bytes,
+            'Peak_Hot_Bytes': total_bytes,
+            'Traced_Peak_Bytes': traced_peak(HashMapContacts()),
+            'Cold_Index_Bytes': 0,
+            'Hit_Rate': 1.0,
+            'Search_Time_ms': timed_lookups(baseline),
+        }]
+        
+        for fraction in budget_fractions:
+            budget = int(total_bytes * fraction)
+            with TieredContacts(budget) as traced:
+                traced_bytes = traced_peak(traced)
+            with TieredContacts(budget) as tiered:
+                load(tiered)
+                search_time = timed_lookups(tiered)
+                rows.append({
+                    'Structure': 'Tiered',
+                    'Budget_Fraction': fraction,
+                    'Budget_Bytes': budget,
+                    'Peak_Hot_Bytes': tiered.peak_hot_bytes,
+                    'Traced_Peak_Bytes': traced_bytes,
+                    'Cold_Index_Bytes': tiered.cold.index_bytes(),
+                    'Hit_Rate': tiered.hit_rate(),
+                    'Search_Time_ms': search_time,
+                })
+        
+        for row in rows:
+            print(f"  {row['Structure']:<8} budget {row['Budget_Fraction']:>5.0%} "
+                  f"({row['Budget_Bytes'] / 1024:8.1f}KB)  peak hot est. {row['Peak_Hot_Bytes'] / 1024:8.1f}KB  "
+                  f"traced peak {row['Traced_Peak_Bytes'] / 1024:8.1f}KB  "
+                  f"cold index {row['Cold_Index_Bytes'] / 1024:8.1f}KB  "
+                  f"hit rate {row['Hit_Rate']:6.1%}  {row['Search_Time_ms']:.6f}ms/search")
+        return rows
     
     def generate_report(self):
         """Generate performance analysis report."""
@@ -436,6 +402,8 @@ class PerformanceTester:
             print("No results to report. Run tests first.")
             return
         
+        import pandas as pd  # Deferred: only reporting needs pandas
+        
         df = pd.DataFrame(self.results)
         
         print("\n" + "=" * 80)
@@ -462,7 +430,26 @@ class PerformanceTester:
         )
         print(search_pivot.round(6))
         
-        print("\n3. ANALYSIS SUMMARY")
+        if 'Search_Comparisons' in df.columns:
+            print("\n3. ALGORITHMIC WORK (Key comparisons per search)")
+            print("-" * 50)
+            work_pivot = df.pivot_table(
+                values='Search_Comparisons',
+                index='Size',
+                columns='Structure',
+                aggfunc='mean'
+            )
+            print(work_pivot.round(1))
+            
+            tree_df = df.dropna(subset=['Tree_Height'])
+            if not tree_df.empty:
+                print("\nTree height (mean depth) vs. ideal log2(n):")
+                for _, row in tree_df.iterrows():
+                    ideal = math.ceil(math.log2(row['Size'] + 1))
+                    print(f"  {row['Structure']:<12} n={row['Size']:<8,} "
+                          f"height {row['Tree_Height']:<6.0f} ({row['Mean_Depth']:.1f})  ideal {ideal}")
+        
+        print("\n4. ANALYSIS SUMMARY")
         print("-" * 30)
         
         # Find best performer for each operation at largest size
@@ -481,8 +468,10 @@ class PerformanceTester:
         
         return df
     
-    def create_visualizations(self, df: pd.DataFrame):
+    def create_visualizations(self, df: 'pd.DataFrame'):
         """Create performance visualization graphs."""
+        import matplotlib.pyplot as plt  # Deferred: only plotting needs matplotlib
+        
         plt.style.use('seaborn-v0_8')
         fig, axes = plt.subplots(2, 2, figsize=(15, 12))
         fig.suptitle('Data Structure Performance Comparison', fontsize=16, fontweight='bold')
@@ -510,10 +499,236 @@ class PerformanceTester:
         plt.tight_layout()
         plt.savefig('performance_comparison.png', dpi=300, bbox_inches='tight')
         plt.show()
+        
+        if 'Search_Comparisons' in df.columns:
+            self.create_work_visualizations(df)
+    
+    def create_work_visualizations(self, df: 'pd.DataFrame'):
+        """Plot the algorithmic work counters and tree shape against dataset size."""
+        import matplotlib.pyplot as plt  # Deferred: only plotting needs matplotlib
+        
+        plt.style.use('seaborn-v0_8')
+        fig, axes = plt.subplots(1, 3, figsize=(18, 5))
+        fig.suptitle('Algorithmic Work per Operation', fontsize=16, fontweight='bold')
+        
+        panels = [('Search_Comparisons', 'Key Comparisons per Search'),
+                  ('Delete_Shifts', 'Element Shifts per Delete')]
+        for ax, (column, title) in zip(axes, panels):
+            for structure in df['Structure'].unique():
+                structure_data = df[df['Structure'] == structure]
+                ax.plot(structure_data['Size'], structure_data[column],
+                        marker='o', label=structure, linewidth=2)
+            ax.set_xlabel('Dataset Size')
+            ax.set_ylabel('Count')
+            ax.set_title(title)
+            ax.legend()
+            ax.grid(True, alpha=0.3)
+        axes[0].set_yscale('log')
+        
+        # Tree shape: a skewed BST shows up as height far above log2(n)
+        ax = axes[2]
+        tree_df = df.dropna(subset=['Tree_Height'])
+        for structure in tree_df['Structure'].unique():
+            structure_data = tree_df[tree_df['Structure'] == structure]
+            ax.plot(structure_data['Size'], structure_data['Tree_Height'],
+                    marker='o', label=f'{structure} height', linewidth=2)
+            ax.plot(structure_data['Size'], structure_data['Mean_Depth'],
+                    marker='s', linestyle=':', label=f'{structure} mean depth')
+        sizes = sorted(df['Size'].unique())
+        ax.plot(sizes, [math.log2(size + 1) for size in sizes], 'k--', alpha=0.5,
+                label='log2(n) ideal')
+        ax.set_xlabel('Dataset Size')
+        ax.set_ylabel('Levels')
+        ax.set_title('Tree Height and Mean Depth')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+        
+        plt.tight_layout()
+        plt.savefig('work_counters.png', dpi=300, bbox_inches='tight')
+        plt.show()
+
+# ==================== PARALLEL BENCHMARK RUNNER ====================
+OPERATIONS = ['Insert', 'Search', 'Update', 'Delete']
+
+WORK_COLUMNS = ['Insert_Comparisons', 'Search_Comparisons', 'Search_Nodes_Visited',
+                'Update_Comparisons', 'Delete_Comparisons', 'Delete_Shifts',
+                'Tree_Height', 'Mean_Depth']
+
+# Per-operation averages are microsecond-scale and easily skewed by
+# neighbouring processes; bulk inserts are long enough to tolerate it.
+TIMING_CRITICAL_OPERATIONS = ('Search', 'Update', 'Delete')
+
+def _pin_worker(cpu_queue) -> None:
+    """Pool initializer: pin this worker process to the next free CPU."""
+    cpu = cpu_queue.get()
+    if hasattr(os, 'sched_setaffinity'):  # Linux only
+        os.sched_setaffinity(0, {cpu})
+
+def run_benchmark_cell(structure_name: str, structure_class, size: int, operation: str,
+                       trials: int, seed: int) -> dict:
+    """Time one (structure, size, operation) cell in isolation.
+    
+    The contact data is regenerated from seed so every process benchmarks the
+    same contacts. Mirrors the workload of PerformanceTester.test_operations
+    and returns the matching '<Op>_Time_ms' / '<Op>_Spread' columns, or the
+    WORK_COLUMNS for the untimed 'Work' pseudo-operation.
+    """
+    contacts = DataGenerator.generate_contacts(size, random.Random(seed + size))
+    search_names = [contact.name for contact in contacts[:min(100, size)]]
+    tester = PerformanceTester()
+    
+    if operation == 'Work':
+        result = {'Structure': structure_name, 'Size': size}
+        result.update(tester.measure_work(structure_class, contacts, search_names))
+        return result
+    
+    structure = structure_class()
+    if operation != 'Insert':
+        for contact in contacts:
+            structure.insert(contact)
+    
+    if operation == 'Insert':
+        def run():
+            fresh = structure_class()
+            for contact in contacts:
+                fresh.insert(contact)
+        per_call = 1
+    elif operation == 'Search':
+        def run():
+            for name in search_names:
+                structure.search(name)
+        per_call = len(search_names)
+    elif operation == 'Update':
+        def run():
+            for name in search_names[:10]:
+                structure.update(name, phone="1234567890", email="updated@test.com")
+        per_call = 10
+    elif operation == 'Delete':
+        def run():
+            for name in search_names[:10]:
+                structure.delete(name)
+        per_call = 10
+    else:
+        raise ValueError(f"Unknown operation: {operation!r}")
+    
+    mean_time, spread = tester.time_operation(run, trials)
+    return {
+        'Structure': structure_name,
+        'Size': size,
+        f'{operation}_Time_ms': mean_time / per_call,
+        f'{operation}_Spread': spread / per_call,
+    }
+
+class ParallelPerformanceTester(PerformanceTester):
+    """Runs independent (structure, size, operation) cells across a process pool.
+    
+    Results are merged back into one row per (structure, size) with the same
+    columns as PerformanceTester, so generate_report(), create_visualizations()
+    and the CSV export work unchanged.
+    """
+    
+    def __init__(self, workers: Optional[int] = None, pin_cpus: bool = False,
+                 serialize_timing_critical: bool = False, count_work: bool = True):
+        super().__init__(count_work)
+        self.workers = workers or os.cpu_count() or 1
+        self.pin_cpus = pin_cpus
+        self.serialize_timing_critical = serialize_timing_critical
+    
+    def _pinning(self) -> bool:
+        return self.pin_cpus and hasattr(os, 'sched_getaffinity')
+    
+    def pool_size(self) -> int:
+        """Worker processes actually started: pinning caps them at the usable CPUs."""
+        if not self._pinning():
+            return self.workers
+        return min(self.workers, len(os.sched_getaffinity(0)))
+    
+    def _make_pool(self) -> ProcessPoolExecutor:
+        if not self._pinning():
+            return ProcessPoolExecutor(max_workers=self.workers)
+        
+        cpus = sorted(os.sched_getaffinity(0))
+        workers = self.pool_size()
+        cpu_queue = multiprocessing.Queue()
+        for cpu in cpus[:workers]:
+            cpu_queue.put(cpu)
+        return ProcessPoolExecutor(max_workers=workers, initializer=_pin_worker,
+                                   initargs=(cpu_queue,))
+    
+    def test_operations(self, data_sizes: List[int], trials: int = 3, seed: int = 42):
+        """Test all operations for all data structures, spreading cells over processes."""
+        print(f"Starting Parallel Performance Tests ({self.pool_size()} workers)...")
+        print("=" * 60)
+        
+        operations = OPERATIONS + ['Work'] if self.count_work else OPERATIONS
+        cells = [(name, cls, size, operation)
+                 for size in data_sizes
+                 for name, cls in self.structures.items()
+                 for operation in operations]
+        # Largest sizes first so the slow O(n) cells do not end up as the tail
+        cells.sort(key=lambda cell: -cell[2])
+        
+        serial_cells = []
+        if self.serialize_timing_critical:
+            serial_cells = [c for c in cells if c[3] in TIMING_CRITICAL_OPERATIONS]
+            cells = [c for c in cells if c[3] not in TIMING_CRITICAL_OPERATIONS]
+        
+        rows: Dict[tuple, dict] = {}
+        
+        def _merge(cell_result: dict) -> None:
+            key = (cell_result['Structure'], cell_result['Size'])
+            rows.setdefault(key, {}).update(cell_result)
+        
+        with self._make_pool() as pool:
+            futures = [pool.submit(run_benchmark_cell, name, cls, size, operation, trials, seed)
+                       for name, cls, size, operation in cells]
+            for future in as_completed(futures):
+                _merge(future.result())
+        
+        # Run noise-sensitive cells one at a time once the pool is idle
+        for name, cls, size, operation in serial_cells:
+            _merge(run_benchmark_cell(name, cls, size, operation, trials, seed))
+        
+        columns = ['Structure', 'Size']
+        for operation in OPERATIONS:
+            columns += [f'{operation}_Time_ms', f'{operation}_Spread']
+        if self.count_work:
+            columns += WORK_COLUMNS
+        
+        for size in data_sizes:
+            print(f"\nResults for {size:,} contacts:")
+            print("-" * 40)
+            for name in self.structures:
+                row = rows[(name, size)]
+                result = {column: row[column] for column in columns}
+                self.results.append(result)
+                print(f"{name}: Insert {result['Insert_Time_ms']:.3f}ms, "
+                      f"Search {result['Search_Time_ms']:.6f}ms, "
+                      f"Update {result['Update_Time_ms']:.3f}ms, "
+                      f"Delete {result['Delete_Time_ms']:.3f}ms")
+                if self.count_work:
+                    self.print_work(result)
 
 # ==================== MAIN EXECUTION ====================
 def main():
     """Main function to run the complete performance comparison."""
+    parser = argparse.ArgumentParser(description="Contact management data structure benchmarks")
+    parser.add_argument('--parallel', action='store_true',
+                        help='spread benchmark cells across a process pool')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='pool size for --parallel (default: CPU count)')
+    parser.add_argument('--pin-cpus', action='store_true',
+                        help='pin each pool worker to its own CPU (Linux only)')
+    parser.add_argument('--serial-timing', action='store_true',
+                        help='run the timing-critical search/update/delete cells serially')
+    parser.add_argument('--skewed', action='store_true',
+                        help='also benchmark self-organizing linked lists under Zipfian lookups')
+    parser.add_argument('--miss-heavy', action='store_true',
+                        help='also benchmark Bloom-guarded lookups where most names are absent')
+    parser.add_argument('--tiered', action='store_true',
+                        help='also benchmark hot/cold tiered storage at several memory budgets')
+    args = parser.parse_args()
+    
     print("Contact Management System Performance Comparison")
     print("=" * 60)
     
@@ -521,7 +736,11 @@ def main():
     data_sizes = [100, 1000, 5000, 10000]
     
     # Initialize and run performance tests
-    tester = PerformanceTester()
+    if args.parallel:
+        tester = ParallelPerformanceTester(workers=args.workers, pin_cpus=args.pin_cpus,
+                                           serialize_timing_critical=args.serial_timing)
+    else:
+        tester = PerformanceTester()
     tester.test_operations(data_sizes, trials=3)
     
     # Generate report and visualizations
@@ -534,6 +753,27 @@ def main():
         df.to_csv('performance_results.csv', index=False)
         print(f"\nResults saved to 'performance_results.csv'")
         print("Visualization saved as 'performance_comparison.png'")
+    
+    if args.skewed:
+        import pandas as pd
+        
+        skewed_df = pd.DataFrame(tester.test_skewed_access())
+        skewed_df.to_csv('skewed_access_results.csv', index=False)
+        print("Skewed access results saved to 'skewed_access_results.csv'")
+    
+    if args.miss_heavy:
+        import pandas as pd
+        
+        miss_df = pd.DataFrame(tester.test_miss_heavy())
+        miss_df.to_csv('miss_heavy_results.csv', index=False)
+        print("Miss-heavy results saved to 'miss_heavy_results.csv'")
+    
+    if args.tiered:
+        import pandas as pd
+        
+        tiered_df = pd.DataFrame(tester.test_tiered())
+        tiered_df.to_csv('tiered_storage_results.csv', index=False)
+        print("Tiered storage results saved to 'tiered_storage_results.csv'")
 
 if __name__ == "__main__":
     # Set random seed for reproducible results
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Import-time / RSS benchmark guarding the startup cost of the core package.
+
+Each import is measured in a fresh interpreter so module caches do not hide
+the cost. Exits with status 1 if importing contact_core exceeds its budget or
+pulls in any of the heavy reporting dependencies.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ['pandas', 'numpy', 'matplotlib', 'seaborn', 'scipy']
+
+# Budgets for `import contact_core`, measured on top of a bare interpreter
+CORE_IMPORT_BUDGET_MS = 50.0
+CORE_RSS_BUDGET_MB = 5.0
+
+_PROBE = '''
+import json, resource, sys, time
+start = time.perf_counter()
+{statement}
+elapsed_ms = (time.perf_counter() - start) * 1000
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # KB on Linux
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(json.dumps({{'ms': elapsed_ms, 'rss_mb': rss_kb / 1024, 'heavy': heavy}}))
+'''
+
+def measure(statement: str, runs: int = 5) -> dict:
+    """Median import time and peak RSS of running statement in a new interpreter."""
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', _PROBE.format(statement=statement, heavy=HEAVY_MODULES)],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+
+    return {
+        'ms': statistics.median(s['ms'] for s in samples),
+        'rss_mb': statistics.median(s['rss_mb'] for s in samples),
+        'heavy': samples[0]['heavy'],
+    }
+
+def main() -> int:
+    print("Import Cost Benchmark")
+    print("=" * 60)
+
+    cases = {
+        'baseline (no import)': 'pass',
+        'contact_core': 'import contact_core',
+        'contact_management_system': 'import contact_management_system',
+        'pandas + matplotlib (old top-level cost)': 'import pandas, matplotlib.pyplot',
+    }
+
+    results = {}
+    for label, statement in cases.items():
+        try:
+            results[label] = measure(statement)
+        except subprocess.CalledProcessError:
+            print(f"{label:42} unavailable")
+            continue
+        r = results[label]
+        print(f"{label:42} {r['ms']:8.1f}ms  {r['rss_mb']:7.1f}MB  heavy={r['heavy']}")
+
+    baseline = results['baseline (no import)']
+    failures = []
+    for label in ('contact_core', 'contact_management_system'):
+        r = results[label]
+        if r['heavy']:
+            failures.append(f"{label} imports heavy modules: {r['heavy']}")
+
+    core = results['contact_core']
+    core_rss = core['rss_mb'] - baseline['rss_mb']
+    if core['ms'] > CORE_IMPORT_BUDGET_MS:
+        failures.append(f"contact_core import took {core['ms']:.1f}ms "
+                        f"(budget {CORE_IMPORT_BUDGET_MS}ms)")
+    if core_rss > CORE_RSS_BUDGET_MB:
+        failures.append(f"contact_core added {core_rss:.1f}MB RSS "
+                        f"(budget {CORE_RSS_BUDGET_MB}MB)")
+
+    print("-" * 60)
+    if failures:
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        return 1
+    print("Startup cost within budget.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""Materialized per-domain and per-area-code aggregates."""
+
+from collections import Counter
+
+import pytest
+
+from contact_core import (ArrayContacts, BSTContacts, Contact, ContactAggregates,
+                          HashMapContacts, LinkedListContacts, email_domain,
+                          phone_area_code)
+
+BACKENDS = [ArrayContacts, LinkedListContacts, HashMapContacts, BSTContacts]
+
+def assert_matches_recount(store, aggregates):
+    assert aggregates.by_domain.counts == Counter(email_domain(c) for c in store)
+    assert aggregates.by_area_code.counts == Counter(phone_area_code(c) for c in store)
+
+def test_key_functions():
+    contact = Contact('A', '+1 (212) 555-0100', 'a@Example.COM')
+    assert email_domain(contact) == 'example.com'
+    assert phone_area_code(contact) == '212'
+    assert email_domain(Contact('B', '12', 'no-at-sign')) == ''
+    assert phone_area_code(Contact('B', '12', '')) == ''
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_existing_contacts_are_counted_on_attach(backend):
+    store = backend()
+    store.insert(Contact('A', '2125550100', 'a@gmail.com'))
+    store.insert(Contact('B', '2125550101', 'b@yahoo.com'))
+    aggregates = ContactAggregates(store)
+    assert aggregates.domain_count('Gmail.com') == 1
+    assert aggregates.area_code_count('212') == 2
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_update_moves_the_contact_between_groups(backend):
+    store = backend()
+    aggregates = ContactAggregates(store)
+    store.insert(Contact('A', '2125550100', 'a@gmail.com'))
+    store.insert(Contact('B', '3125550100', 'b@gmail.com'))
+    store.update('A', phone='4155550100', email='a@yahoo.com')
+    assert aggregates.by_domain.counts == {'gmail.com': 1, 'yahoo.com': 1}
+    assert aggregates.by_area_code.counts == {'312': 1, '415': 1}
+    store.delete('B')
+    assert_matches_recount(store, aggregates)
+
+def test_replacing_insert_drops_the_old_contact():
+    store = HashMapContacts()
+    aggregates = ContactAggregates(store)
+    store.insert(Contact('A', '2125550100', 'a@gmail.com'))
+    store.insert(Contact('A', '2125550100', 'a@yahoo.com'))
+    assert aggregates.by_domain.counts == {'yahoo.com': 1}
+
+def test_top_k_and_detach():
+    store = ArrayContacts()
+    aggregates = ContactAggregates(store)
+    for i, domain in enumerate(['gmail.com'] * 3 + ['yahoo.com'] * 2 + ['example.com']):
+        store.insert(Contact(f'N{i}', '2125550100', f'n{i}@{domain}'))
+    assert aggregates.top_k_domains(2) == [('gmail.com', 3), ('yahoo.com', 2)]
+    
+    aggregates.detach()
+    store.insert(Contact('Late', '2125550100', 'late@gmail.com'))
+    assert aggregates.domain_count('gmail.com') == 3
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_contact_changed_through_another_store_is_removed_from_its_counted_group(backend):
+    shared = Contact('A', '2125550100', 'a@gmail.com')
+    first, second = backend(), backend()
+    first.insert(shared)
+    second.insert(shared)
+    aggregates = ContactAggregates(second)
+    
+    first.update('A', phone='3125550100', email='a@yahoo.com')  # second is not notified
+    assert aggregates.by_domain.counts == {'gmail.com': 1}
+    second.delete('A')
+    assert aggregates.by_domain.counts == {} and aggregates.by_area_code.counts == {}
+
+def test_one_object_stored_twice_moves_both_occurrences():
+    contact = Contact('A', '2125550100', 'a@gmail.com')
+    store = ArrayContacts()
+    aggregates = ContactAggregates(store)
+    store.insert(contact)
+    store.insert(contact)
+    store.update('A', email='a@yahoo.com')
+    assert_matches_recount(store, aggregates)
+    store.delete('A')
+    assert_matches_recount(store, aggregates)
+
+@pytest.mark.parametrize('backend', [ArrayContacts, LinkedListContacts, BSTContacts])
+def test_update_of_a_duplicate_name_moves_the_updated_contact(backend):
+    store = backend()
+    store.insert(Contact('X', '2125550100', 'x@gmail.com'))
+    store.insert(Contact('X', '3125550100', 'x@yahoo.com'))
+    aggregates = ContactAggregates(store)
+    store.update('X', email='x@yahoo.com')
+    assert_matches_recount(store, aggregates)
+    store.delete('X')
+    assert_matches_recount(store, aggregates)
@@ -0,0 +1,47 @@
+"""Benchmark cells and the process-pool runner."""
+
+import os
+import random
+
+from contact_core import ArrayContacts, HashMapContacts
+from contact_management_system import (WORK_COLUMNS, ParallelPerformanceTester, PerformanceTester,
+                                       run_benchmark_cell)
+
+def test_cell_columns():
+    result = run_benchmark_cell('HashMap', HashMapContacts, 50, 'Delete', trials=1, seed=42)
+    assert set(result) == {'Structure', 'Size', 'Delete_Time_ms', 'Delete_Spread'}
+    assert result['Structure'] == 'HashMap' and result['Size'] == 50
+
+def test_parallel_run_merges_one_row_per_structure_and_size():
+    tester = ParallelPerformanceTester(workers=2, serialize_timing_critical=True)
+    tester.structures = {'Array': ArrayContacts, 'HashMap': HashMapContacts}
+    tester.test_operations([20, 40], trials=1)
+    
+    assert sorted((row['Structure'], row['Size']) for row in tester.results) == [
+        ('Array', 20), ('Array', 40), ('HashMap', 20), ('HashMap', 40)]
+    for row in tester.results:
+        for operation in ('Insert', 'Search', 'Update', 'Delete'):
+            assert row[f'{operation}_Time_ms'] >= 0
+
+def test_work_cell_reports_counters():
+    result = run_benchmark_cell('Array', ArrayContacts, 50, 'Work', trials=1, seed=42)
+    assert set(WORK_COLUMNS) <= set(result)
+    assert result['Search_Comparisons'] > 0
+
+def test_serial_and_parallel_runs_use_the_same_data():
+    state = random.getstate()
+    serial = PerformanceTester()
+    serial.structures = {'Array': ArrayContacts}
+    serial.test_operations([30], trials=1, seed=7)
+    cell = run_benchmark_cell('Array', ArrayContacts, 30, 'Work', trials=1, seed=7)
+    
+    assert random.getstate() == state
+    assert {column: serial.results[0][column] for column in WORK_COLUMNS} == {
+        column: cell[column] for column in WORK_COLUMNS}
+
+def test_pool_size_is_capped_by_pinning():
+    tester = ParallelPerformanceTester(workers=10_000, pin_cpus=True)
+    if hasattr(os, 'sched_getaffinity'):
+        assert tester.pool_size() == len(os.sched_getaffinity(0))
+    else:
+        assert tester.pool_size() == 10_000
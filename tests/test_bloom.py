@@ -0,0 +1,65 @@
+"""Bloom filters and the Bloom-guarded contact manager."""
+
+import pytest
+
+from contact_core import (ArrayContacts, BloomFilter, BloomGuardedContacts, Contact,
+                          CountingBloomFilter, HashMapContacts, IndexedArrayContacts)
+
+def test_plain_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=500, false_positive_rate=0.01)
+    keys = [f'key{i}' for i in range(500)]
+    for key in keys:
+        bloom.add(key)
+    assert all(key in bloom for key in keys)
+    false_positives = sum(f'other{i}' in bloom for i in range(5000))
+    assert false_positives / 5000 < 0.05
+
+def test_counting_filter_removes_one_occurrence_at_a_time():
+    bloom = CountingBloomFilter(capacity=100)
+    bloom.add('alice')
+    bloom.add('alice')
+    assert bloom.remove('alice') and 'alice' in bloom
+    assert bloom.remove('alice') and 'alice' not in bloom
+    assert not bloom.remove('alice')
+
+def test_filter_answers_definite_misses_without_the_backend():
+    guarded = BloomGuardedContacts(ArrayContacts(), capacity=100)
+    guarded.insert(Contact('Alice', '5550000000', 'alice@example.com'))
+    assert guarded.search('Alice').email == 'alice@example.com'
+    assert guarded.search('Bob') is None
+    assert not guarded.update('Bob', phone='5551112222') and not guarded.delete('Bob')
+    assert guarded.filtered == 3 and guarded.passed == 1
+
+@pytest.mark.parametrize('counting', [True, False])
+def test_rebuilds_keep_every_stored_name(counting):
+    guarded = BloomGuardedContacts(HashMapContacts(), capacity=4, counting=counting)
+    for i in range(100):
+        guarded.insert(Contact(f'Name{i}', '5550000000', 'x@example.com'))
+    for i in range(0, 100, 3):
+        guarded.delete(f'Name{i}')
+    assert guarded.filter.capacity >= 100
+    assert all(guarded.search(contact.name) is contact for contact in guarded.backend)
+
+def test_counting_guard_forgets_deleted_names():
+    guarded = BloomGuardedContacts(ArrayContacts(), capacity=100)
+    guarded.insert(Contact('Alice', '5550000000', 'alice@example.com'))
+    guarded.delete('Alice')
+    assert 'Alice' not in guarded.filter
+
+@pytest.mark.parametrize('backend', [HashMapContacts, IndexedArrayContacts])
+def test_replacing_insert_does_not_add_the_name_twice(backend):
+    guarded = BloomGuardedContacts(backend(), capacity=100)
+    guarded.insert(Contact('Alice', '5550000000', 'alice@example.com'))
+    guarded.insert(Contact('Alice', '5559999999', 'alice@example.com'))
+    assert guarded.filter.count == 1
+    assert guarded.delete('Alice')
+    assert 'Alice' not in guarded.filter
+
+def test_false_positive_rate_is_over_absent_names():
+    guarded = BloomGuardedContacts(ArrayContacts(), capacity=100)
+    guarded.insert(Contact('Alice', '5550000000', 'alice@example.com'))
+    guarded.search('Alice')
+    guarded.search('Bob')
+    guarded.filter.add('Carol')  # Force one false positive
+    guarded.search('Carol')
+    assert guarded.observed_false_positive_rate() == 0.5
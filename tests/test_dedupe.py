@@ -0,0 +1,62 @@
+"""Duplicate detection and merging."""
+
+import pytest
+
+from contact_core import (ArrayContacts, BSTContacts, Contact, DedupeEngine, HashMapContacts,
+                          LinkedListContacts, merge_keep_first, merge_most_complete, name_key,
+                          normalize_email, normalize_phone, soundex)
+
+def test_normalizers():
+    assert normalize_phone('+1 (555) 123-4567') == '5551234567'
+    assert normalize_email(' John.Smith+work@Example.COM ') == 'john.smith@example.com'
+    assert soundex('Robert') == soundex('Rupert') == 'R163'
+    assert name_key('Jon  Smyth') == name_key('John Smith')
+
+def test_shared_phone_groups_similar_names_only():
+    contacts = [Contact('John Smith', '555-123-4567', 'john@example.com'),
+                Contact('Jon Smith', '(555) 123 4567', ''),
+                Contact('Alice Jones', '5551234567', 'alice@example.com')]
+    groups = [group for batch in DedupeEngine().find_duplicates(contacts) for group in batch]
+    assert len(groups) == 1
+    assert {member.name for member in groups[0].members} == {'John Smith', 'Jon Smith'}
+
+def test_name_only_matches_can_be_disabled():
+    contacts = [Contact('Katherine Johnson', '5550000001', ''),
+                Contact('Katherine Johnsonn', '5550000002', '')]
+    assert list(DedupeEngine().find_duplicates(contacts))
+    assert not list(DedupeEngine(name_only_threshold=None).find_duplicates(contacts))
+
+def test_merge_policies():
+    group = [Contact('Jon Smith', '', 'jon@example.com'), Contact('Jonathan Smith', '5551234567', '')]
+    assert merge_keep_first(group).name == 'Jon Smith'
+    merged = merge_most_complete(group)
+    assert (merged.name, merged.phone, merged.email) == ('Jonathan Smith', '5551234567', 'jon@example.com')
+    with pytest.raises(ValueError):
+        DedupeEngine(merge_policy='keep_longest')
+
+def test_merge_into_replaces_each_group():
+    store = HashMapContacts()
+    store.insert(Contact('John Smith', '5551234567', 'john@example.com'))
+    store.insert(Contact('Jon Smith', '5551234567', ''))
+    store.insert(Contact('Alice Jones', '5559876543', 'alice@example.com'))
+    assert DedupeEngine().merge_into(store) == 1
+    assert sorted(c.name for c in store) == ['Alice Jones', 'John Smith']
+
+def test_batches_respect_batch_size():
+    contacts = []
+    for i in range(25):
+        phone = f'555{i:07d}'
+        contacts += [Contact(f'Person {i}', phone, ''), Contact(f'Persn {i}', phone, '')]
+    batches = list(DedupeEngine().find_duplicates(contacts, batch_size=10))
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+
+@pytest.mark.parametrize('backend', [ArrayContacts, LinkedListContacts, BSTContacts])
+def test_merge_never_deletes_a_same_name_non_member(backend):
+    store = backend()
+    store.insert(Contact('John Smith', '5559990000', 'js1@example.com'))
+    store.insert(Contact('John Smith', '5551234567', 'js2@example.com'))
+    store.insert(Contact('Jon Smith', '5551234567', 'js2@example.com'))
+    before = sorted((c.name, c.phone, c.email) for c in store)
+    
+    assert DedupeEngine(name_only_threshold=None).merge_into(store) == 0
+    assert sorted((c.name, c.phone, c.email) for c in store) == before
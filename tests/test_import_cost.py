@@ -0,0 +1,14 @@
+"""Startup-cost guard: the core package must stay free of heavy dependencies.
+
+The millisecond/MB budgets are checked by running import_benchmark.py
+directly; shared CI runners are too noisy to assert timings here.
+"""
+
+import pytest
+
+from import_benchmark import HEAVY_MODULES, measure
+
+@pytest.mark.parametrize('module', ['contact_core', 'contact_management_system'])
+def test_import_pulls_in_no_heavy_modules(module):
+    result = measure(f'import {module}', runs=1)
+    assert result['heavy'] == [], f"{module} imports {result['heavy']} (checked: {HEAVY_MODULES})"
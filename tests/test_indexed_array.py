@@ -0,0 +1,65 @@
+"""IndexedArrayContacts: slot index, tombstones and compaction."""
+
+import pytest
+
+from contact_core import Contact, IndexedArrayContacts
+
+def fill(store, names):
+    for name in names:
+        store.insert(Contact(name, '5550000000', f'{name.lower()}@example.com'))
+    return store
+
+def assert_index_consistent(store):
+    assert all(store.slots[slot].name == name for name, slot in store.index.items())
+    assert store.size() == len(store.index) == sum(c is not None for c in store.slots)
+
+def test_lookup_update_and_delete():
+    store = fill(IndexedArrayContacts(), 'ABCD')
+    assert store.search('C').email == 'c@example.com'
+    assert store.update('C', phone='5551112222') and store.search('C').phone == '5551112222'
+    assert store.delete('C') and not store.delete('C')
+    assert store.search('C') is None and not store.update('C', phone='5551112222')
+    assert_index_consistent(store)
+
+def test_tombstones_keep_order_until_compaction():
+    store = fill(IndexedArrayContacts(compaction_threshold=0.4), 'ABCDEF')
+    store.delete('B')
+    store.delete('D')
+    assert store.dead_ratio() == pytest.approx(2 / 6)
+    assert [c.name for c in store] == ['A', 'C', 'E', 'F']
+    
+    store.delete('A')  # 3 of 6 slots dead is over 0.4
+    assert store.dead_ratio() == 0.0 and len(store.slots) == 3
+    assert [c.name for c in store] == ['C', 'E', 'F']
+    assert_index_consistent(store)
+
+def test_compaction_triggers_when_the_threshold_is_reached():
+    store = fill(IndexedArrayContacts(), 'ABCD')
+    store.delete('A')
+    store.delete('B')  # Exactly half the slots dead
+    assert len(store.slots) == 2
+    
+    store = fill(IndexedArrayContacts(compaction_threshold=1.0), 'AB')
+    store.delete('A')
+    store.delete('B')  # Every slot dead: a threshold of 1.0 still compacts
+    assert store.slots == [] and store.dead_ratio() == 0.0
+
+def test_swap_delete_moves_the_last_contact():
+    store = fill(IndexedArrayContacts(preserve_order=False), 'ABCD')
+    store.delete('A')
+    assert [c.name for c in store] == ['D', 'B', 'C']
+    store.delete('C')  # Already last: nothing to move
+    assert [c.name for c in store] == ['D', 'B']
+    assert_index_consistent(store)
+
+def test_inserting_an_existing_name_replaces_it():
+    store = fill(IndexedArrayContacts(), 'AB')
+    store.insert(Contact('A', '5559999999', 'new@example.com'))
+    assert store.size() == 2 and store.search('A').email == 'new@example.com'
+    assert [c.name for c in store] == ['A', 'B']
+
+def test_threshold_is_validated():
+    with pytest.raises(ValueError):
+        IndexedArrayContacts(compaction_threshold=0)
+    with pytest.raises(ValueError):
+        IndexedArrayContacts(compaction_threshold=1.5)
@@ -0,0 +1,70 @@
+"""Operation counters for algorithmic work."""
+
+from contact_core import (ArrayContacts, BSTContacts, Contact, HashMapContacts, LinkedListContacts,
+                          OperationCounters)
+
+def fill(store, names):
+    for name in names:
+        store.insert(Contact(name, '5550000000', f'{name}@example.com'))
+    return store
+
+def test_counters_are_off_by_default():
+    store = fill(ArrayContacts(), 'ABC')
+    store.search('C')
+    assert store.counters is None
+
+def test_array_counts_comparisons_and_shifts():
+    store = fill(ArrayContacts(), 'ABCDE')
+    counters = store.enable_instrumentation()
+    store.search('C')
+    store.search('Z')
+    store.delete('B')
+    assert counters.total('search', 'comparisons') == 3 + 5
+    assert counters.total('delete', 'shifts') == 3
+    assert counters.average('search', 'comparisons') == 4
+
+def test_update_is_not_counted_as_a_search():
+    store = fill(LinkedListContacts(), 'ABC')
+    counters = store.enable_instrumentation()
+    store.update('A', phone='5551112222')  # 'A' is at the tail
+    assert counters.total('update', 'nodes_visited') == 3
+    assert counters.total('search', 'calls') == 0
+
+def test_bst_descent_and_shape():
+    store = BSTContacts()
+    counters = store.enable_instrumentation()
+    fill(store, 'DBFACEG')
+    store.search('G')
+    assert counters.total('search', 'nodes_visited') == 3
+    assert counters.total('search', 'comparisons') == 5  # == and < at D and F, == at G
+    assert store.height() == 3
+    assert store.depth_distribution() == {0: 1, 1: 2, 2: 4}
+    
+    skewed = fill(BSTContacts(), 'ABCDE')
+    assert skewed.height() == 5
+
+def test_disable_and_reset():
+    store = fill(HashMapContacts(), 'AB')
+    counters = store.enable_instrumentation()
+    store.search('A')
+    counters.reset()
+    assert counters.total('search', 'calls') == 0
+    store.disable_instrumentation()
+    store.search('A')
+    assert store.counters is None and isinstance(counters, OperationCounters)
+
+def test_bst_two_child_delete_counts_the_successor_descent():
+    store = fill(BSTContacts(), 'DBFACEG')
+    counters = store.enable_instrumentation()
+    assert store.delete('B')
+    # D, B, then the successor C found once and removed by a second descent
+    assert counters.total('delete', 'nodes_visited') == 4
+    assert counters.total('delete', 'comparisons') == 5
+    assert [c.name for c in store] == list('ACDEFG')
+
+def test_self_organizing_walk_counts_match_the_real_walk():
+    store = fill(LinkedListContacts(policy='move_to_front'), 'ABC')  # C, B, A
+    counters = store.enable_instrumentation()
+    store.search('A')
+    store.search('A')
+    assert counters.total('search', 'comparisons') == 3 + 1
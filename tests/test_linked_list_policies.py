@@ -0,0 +1,73 @@
+"""Self-organizing LinkedListContacts policies."""
+
+import pytest
+
+from contact_core import Contact, LinkedListContacts
+
+def names_in_order(store):
+    return [contact.name for contact in store]
+
+def iter_nodes(store):
+    node = store.head
+    while node:
+        yield node
+        node = node.next
+
+def build(policy, names):
+    store = LinkedListContacts(policy)
+    for name in reversed(names):  # Inserts go to the head
+        store.insert(Contact(name, '5550000000', f'{name}@example.com'))
+    return store
+
+def test_move_to_front():
+    store = build('move_to_front', ['A', 'B', 'C', 'D'])
+    store.search('C')
+    assert names_in_order(store) == ['C', 'A', 'B', 'D']
+    store.update('D', phone='5551112222')
+    assert names_in_order(store) == ['D', 'C', 'A', 'B']
+
+def test_transpose():
+    store = build('transpose', ['A', 'B', 'C', 'D'])
+    store.search('C')
+    assert names_in_order(store) == ['A', 'C', 'B', 'D']
+    store.search('C')
+    assert names_in_order(store) == ['C', 'A', 'B', 'D']
+    store.search('C')
+    assert names_in_order(store) == ['C', 'A', 'B', 'D']
+
+def test_count_orders_by_access_frequency():
+    store = build('count', ['A', 'B', 'C', 'D'])
+    for name, hits in (('D', 3), ('B', 2), ('C', 1)):
+        for _ in range(hits):
+            store.search(name)
+    assert names_in_order(store) == ['D', 'B', 'C', 'A']
+
+def test_count_inserts_new_contacts_after_accessed_ones():
+    store = build('count', ['Z', 'Y', 'X'])
+    for _ in range(5):
+        store.search('Y')
+    store.insert(Contact('N', '5550000000', 'N@example.com'))
+    assert names_in_order(store) == ['Y', 'N', 'Z', 'X']
+    store.search('Z')
+    store.search('Z')
+    assert names_in_order(store) == ['Y', 'Z', 'N', 'X']
+    counts = [node.count for node in iter_nodes(store)]
+    assert counts == sorted(counts, reverse=True)
+
+def test_static_list_keeps_its_order():
+    store = build(None, ['A', 'B', 'C'])
+    store.search('C')
+    assert names_in_order(store) == ['A', 'B', 'C']
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        LinkedListContacts('most_recent')
+
+def test_reordering_keeps_every_contact():
+    for policy in ('move_to_front', 'transpose', 'count'):
+        store = build(policy, ['A', 'B', 'C', 'D', 'E'])
+        for name in 'EDEEBZ':
+            store.search(name)
+        assert store.update('D', phone='5551112222') and store.search('D').phone == '5551112222'
+        assert store.delete('E') and store.size() == 4
+        assert sorted(names_in_order(store)) == ['A', 'B', 'C', 'D']
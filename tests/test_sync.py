@@ -0,0 +1,101 @@
+"""Merkle-hashed delta sync between contact stores."""
+
+import pytest
+
+from contact_core import (ArrayContacts, BSTContacts, Contact, HashMapContacts, LinkedListContacts,
+                          LocalPeer, MerkleIndex, MerkleSync, contact_digest)
+
+MULTI_NAME_BACKENDS = [ArrayContacts, LinkedListContacts, BSTContacts]
+
+def contents(manager):
+    return sorted((c.name, c.phone, c.email) for c in manager)
+
+def replicas(backend=HashMapContacts, depth=6):
+    local, remote = backend(), backend()
+    local_index, remote_index = MerkleIndex(local, depth), MerkleIndex(remote, depth)
+    peer = LocalPeer(remote_index)
+    return local, remote, MerkleSync(local_index, peer), peer
+
+def fill(store, count, start=0):
+    for i in range(start, start + count):
+        store.insert(Contact(f'Name{i}', f'555{i:07d}', f'name{i}@example.com'))
+
+def test_digest_covers_every_field():
+    contact = Contact('A', '5550000000', 'a@example.com')
+    assert contact_digest(contact) != contact_digest(Contact('A', '5550000000', 'b@example.com'))
+    assert contact_digest(contact) == contact_digest(Contact('A', '5550000000', 'a@example.com'))
+
+def test_identical_stores_cost_one_request():
+    local, remote, sync, peer = replicas()
+    fill(local, 50)
+    fill(remote, 50)
+    assert sync.diff().is_empty()
+    assert peer.requests == 1 and peer.contacts_sent == 0
+
+@pytest.mark.parametrize('backend', [HashMapContacts, ArrayContacts])
+def test_pull_fetches_only_the_delta(backend):
+    local, remote, sync, peer = replicas(backend)
+    fill(local, 200)
+    fill(remote, 200)
+    fill(remote, 5, start=200)              # Remote-only
+    remote.update('Name3', email='changed@example.com')  # Conflict
+    fill(local, 2, start=300)               # Local-only
+    
+    delta = sync.pull()
+    assert sorted(delta.missing_local) == [f'Name{i}' for i in range(200, 205)]
+    assert delta.conflicting == ['Name3']
+    assert sorted(delta.missing_remote) == ['Name300', 'Name301']
+    assert peer.contacts_sent == 6
+    assert local.search('Name3').email == 'changed@example.com'
+    assert local.size() == 207
+    
+    sync.pull(mirror=True)
+    assert contents(local) == contents(remote)
+    assert sync.diff().is_empty()
+
+def test_depths_must_match():
+    with pytest.raises(ValueError):
+        MerkleSync(MerkleIndex(HashMapContacts(), 4), LocalPeer(MerkleIndex(HashMapContacts(), 5)))
+
+def test_identical_contacts_do_not_cancel_out():
+    local, remote, sync, _ = replicas(ArrayContacts, depth=4)
+    remote.insert(Contact('X', '5550000001', 'x@example.com'))
+    remote.insert(Contact('X', '5550000001', 'x@example.com'))
+    
+    assert sync.local.root_hash() != sync.peer.index.root_hash()
+    assert sync.diff().missing_local == ['X']
+
+@pytest.mark.parametrize('backend', MULTI_NAME_BACKENDS)
+def test_pull_brings_over_every_contact_with_a_name(backend):
+    local, remote, sync, _ = replicas(backend, depth=4)
+    remote.insert(Contact('X', '5550000001', 'x1@example.com'))
+    remote.insert(Contact('X', '5550000002', 'x2@example.com'))
+    local.insert(Contact('X', '5550000003', 'x3@example.com'))
+    
+    assert sync.pull().conflicting == ['X']
+    assert contents(local) == contents(remote)
+    assert sync.diff().is_empty()
+
+def test_shared_contact_changed_elsewhere_is_removed_as_indexed():
+    shared = Contact('X', '5550000001', 'x@example.com')
+    first, second = ArrayContacts(), ArrayContacts()
+    index = MerkleIndex(second, depth=4)
+    empty_root = index.root_hash()
+    first.insert(shared)
+    second.insert(shared)
+    
+    first.update('X', email='x@changed.com')  # second's index is not told
+    assert second.delete('X')
+    assert index.root_hash() == empty_root
+    assert index.leaf_digests(index.leaf_of('X')) == {}
+
+def test_index_tracks_updates_of_duplicate_names():
+    store = ArrayContacts()
+    index = MerkleIndex(store, depth=4)
+    store.insert(Contact('X', '1', 'x@gmail.com'))
+    store.insert(Contact('X', '2', 'x@yahoo.com'))
+    store.update('X', email='x@yahoo.com')
+    
+    rebuilt = ArrayContacts()
+    rebuilt.insert_many(Contact(c.name, c.phone, c.email) for c in store)
+    assert MerkleIndex(rebuilt, depth=4).root_hash() == index.root_hash()
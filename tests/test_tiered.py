@@ -0,0 +1,114 @@
+"""Tiered hot/cold contact storage."""
+
+import gc
+import os
+from collections import Counter
+
+from contact_core import (ColdStore, Contact, ContactAggregates, TieredContacts, contact_bytes,
+                          email_domain)
+
+def make(i):
+    return Contact(f'Name{i:02d}', f'555{i:07d}', f'name{i}@example.com')
+
+def three_contact_budget():
+    return 3 * contact_bytes(make(0))
+
+def test_least_recently_used_contacts_spill_to_disk():
+    with TieredContacts(three_contact_budget()) as tiered:
+        for i in range(5):
+            tiered.insert(make(i))
+        assert sorted(c.name for c in tiered.hot) == ['Name02', 'Name03', 'Name04']
+        assert sorted(tiered.cold.index) == ['Name00', 'Name01']
+        assert tiered.hot_bytes <= tiered.memory_budget
+        assert tiered.size() == 5
+
+def test_cold_contacts_are_promoted_on_access():
+    with TieredContacts(three_contact_budget()) as tiered:
+        for i in range(5):
+            tiered.insert(make(i))
+        assert tiered.search('Name00').email == 'name0@example.com'
+        assert 'Name00' not in tiered.cold and 'Name02' in tiered.cold
+        assert tiered.update('Name01', phone='5551112222')
+        assert tiered.search('Name01').phone == '5551112222'
+        assert (tiered.cold_hits, tiered.misses) == (2, 0)
+        assert tiered.search('Nobody') is None and tiered.misses == 1
+
+def test_contact_larger_than_the_budget_stays_cold():
+    with TieredContacts(three_contact_budget()) as tiered:
+        for i in range(3):
+            tiered.insert(make(i))
+        large = Contact('Large', '5550000000', 'x' * tiered.memory_budget)
+        tiered.insert(large)
+        assert tiered.hot_bytes <= tiered.memory_budget
+        assert 'Large' in tiered.cold and tiered.hot.size() == 3
+        assert tiered.search('Large').email == large.email
+        assert tiered.update('Large', phone='5551112222')
+        assert tiered.search('Large').phone == '5551112222'
+        assert tiered.update('Large', email='small@example.com')  # Now fits
+        assert 'Large' not in tiered.cold and tiered.search('Large').email == 'small@example.com'
+        assert tiered.size() == 4
+        assert tiered.peak_hot_bytes <= tiered.memory_budget
+
+def test_delete_and_replace_reach_the_cold_tier():
+    with TieredContacts(three_contact_budget()) as tiered:
+        for i in range(5):
+            tiered.insert(make(i))
+        assert tiered.delete('Name00') and not tiered.delete('Name00')
+        tiered.insert(Contact('Name01', '5559999999', 'new@example.com'))
+        assert tiered.size() == 4 and 'Name01' not in tiered.cold
+        assert tiered.search('Name01').email == 'new@example.com'
+
+def test_cold_store_round_trips_any_characters():
+    store = ColdStore()
+    store.put(Contact('a\0b', '555\0', 'é\0\n@example.com'))
+    store.put(Contact('', '', ''))
+    restored = store.get('a\0b')
+    assert (restored.name, restored.phone, restored.email) == ('a\0b', '555\0', 'é\0\n@example.com')
+    assert store.get('').email == ''
+    store.close()
+
+def test_cold_store_compacts_dead_records():
+    store = ColdStore()
+    for i in range(50):
+        store.put(Contact('Same', str(i), 'same@example.com'))
+    assert len(store) == 1 and store.get('Same').phone == '49'
+    assert store.dead_bytes <= store.live_bytes
+    store.close()
+
+def test_cold_file_is_removed_when_collected():
+    store = ColdStore()
+    path = store.path
+    del store
+    gc.collect()
+    assert not os.path.exists(path)
+
+def test_close_can_keep_the_file():
+    store = ColdStore()
+    store.close(remove=False)
+    assert os.path.exists(store.path)
+    os.remove(store.path)
+
+def test_close_removes_the_cold_file():
+    tiered = TieredContacts(three_contact_budget())
+    path = tiered.cold.path
+    assert os.path.exists(path)
+    tiered.close()
+    assert not os.path.exists(path)
+
+def test_aggregates_follow_contacts_across_tiers():
+    with TieredContacts(three_contact_budget()) as tiered:
+        aggregates = ContactAggregates(tiered)
+        for i in range(5):
+            tiered.insert(make(i))
+        assert tiered.update('Name00', email='name0@cold.com')  # Promoted from disk
+        assert tiered.delete('Name02')                          # Deleted while cold
+        tiered.insert(Contact('Name01', '5550000001', 'name1@cold.com'))
+        assert aggregates.by_domain.counts == Counter(email_domain(c) for c in tiered)
+        assert aggregates.by_domain.counts == {'example.com': 2, 'cold.com': 2}
+
+def test_cold_index_cost_grows_with_cold_contacts():
+    with TieredContacts(three_contact_budget()) as tiered:
+        empty = tiered.cold.index_bytes()
+        for i in range(20):
+            tiered.insert(make(i))
+        assert len(tiered.cold) > 0 and tiered.cold.index_bytes() > empty